@@ -9,22 +9,233 @@
 # ======================================== 导入相关模块 =========================================
 
 import ast
+import hashlib
+import json
 import os
 import sys
-import argparse
+import heapq
+import operator
+from array import array
 from collections import defaultdict, deque
-from typing import Dict, List, Optional, Set, Tuple, Callable
+from typing import Dict, List, Optional, Set, Tuple, Callable, Iterator, BinaryIO, Union
 import re
-import html
-import math
+
+try:
+    # 可选依赖：存在时用于加速导入缓存的读写 (Optional dependency: speeds up import cache I/O when available)
+    import orjson
+except ImportError:
+    orjson = None
 
 # ======================================== 全局变量 ============================================
 
+# 任何 import / from-import 语句都包含独立的 import 关键字；源码中找不到该单词即可跳过导入语句的遍历
+# (Every import / from-import statement contains the standalone keyword import; sources without the word can skip the import walk)
+_IMPORT_WORD_RE: re.Pattern = re.compile(rb"\bimport\b")
+
 # ======================================== 功能函数 ============================================
 
+
+def _json_dumps(obj: object) -> bytes:
+    """
+    将对象序列化为 JSON 字节串，优先使用 orjson，否则退回标准库 json。
+
+    Args:
+        obj (object): 需要序列化的对象（仅包含 dict/list/str/int 等 JSON 类型）。
+
+    Returns:
+        bytes: UTF-8 编码的 JSON 字节串。
+
+    ==========================================
+
+    Serialize an object to JSON bytes, preferring orjson and falling back to the standard json module.
+
+    Args:
+        obj (object): Object to serialize (containing JSON types only, such as dict/list/str/int).
+
+    Returns:
+        bytes: UTF-8 encoded JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> object:
+    """
+    将 JSON 字节串反序列化为对象，优先使用 orjson，否则退回标准库 json。
+
+    Args:
+        data (bytes): UTF-8 编码的 JSON 字节串。
+
+    Returns:
+        object: 反序列化得到的对象。
+
+    ==========================================
+
+    Deserialize JSON bytes to an object, preferring orjson and falling back to the standard json module.
+
+    Args:
+        data (bytes): UTF-8 encoded JSON bytes.
+
+    Returns:
+        object: The deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_py_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    以显式目录栈和os.scandir递归遍历目录，逐个产出.py文件的目录项。
+
+    跳过隐藏目录（以.开头）和__pycache__目录，与os.walk一样不进入符号链接目录，并忽略无法读取的目录。
+    目录项自带类型信息并缓存stat结果，调用方可直接取得大小和修改时间。
+
+    Args:
+        root (str): 需要遍历的根目录。
+
+    Yields:
+        os.DirEntry: 每个.py文件的目录项。
+
+    ==========================================
+
+    Walk a directory tree with an explicit directory stack and os.scandir, yielding the directory entry of each .py file.
+
+    Hidden directories (starting with .) and __pycache__ are skipped, directory symlinks are not followed (like os.walk),
+    and unreadable directories are ignored. Entries carry their type and cache their stat result, so callers get size and mtime directly.
+
+    Args:
+        root (str): Root directory to walk.
+
+    Yields:
+        os.DirEntry: Directory entry of each .py file.
+    """
+    stack: List[str] = [root]
+    while stack:
+        dirpath: str = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            # 与 os.walk 一致，忽略无法读取的目录 (Like os.walk, ignore unreadable directories)
+            continue
+        with it:
+            for entry in it:
+                name: str = entry.name
+                try:
+                    is_dir: bool = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # 排除 __pycache__ 等不需要的目录，且不进入符号链接目录
+                    # (Exclude unwanted directories like __pycache__, and do not follow directory symlinks)
+                    if not name.startswith(".") and name != "__pycache__" and not entry.is_symlink():
+                        stack.append(entry.path)
+                elif name.endswith(".py"):
+                    yield entry
+
+
+def _read_imports(
+    path: str, known_digest: Optional[str], want_digest: bool
+) -> Tuple[str, Optional[List[ast.stmt]], Optional[str]]:
+    """
+    读取并解析单个Python文件，返回其中的导入语句节点。
+
+    该函数不依赖分析器状态，可在工作进程中执行；导入名的解析仍由主进程完成。
+    源码中不含import单词时仍调用ast.parse以报告语法错误，但跳过导入语句的遍历，直接返回空列表。
+
+    Args:
+        path (str): 文件绝对路径。
+        known_digest (Optional[str]): 缓存中记录的内容SHA-1，与当前内容一致时跳过解析。
+        want_digest (bool): 是否计算内容SHA-1（仅启用缓存时需要）。
+
+    Returns:
+        Tuple[str, Optional[List[ast.stmt]], Optional[str]]: (内容SHA-1, 导入语句节点列表, 错误信息)。
+            内容与known_digest一致时节点列表和错误信息均为None；读取或解析失败时节点列表为None。
+
+    ==========================================
+
+    Read and parse a single Python file, returning its import statement nodes.
+
+    The function does not depend on analyzer state and can run in a worker process; import names are still resolved by the main process.
+    Sources without the word import are still parsed with ast.parse so syntax errors are reported, but the import walk is skipped and an empty list is returned.
+
+    Args:
+        path (str): Absolute path of the file.
+        known_digest (Optional[str]): Content SHA-1 recorded in the cache; parsing is skipped when it matches the current content.
+        want_digest (bool): Whether to compute the content SHA-1 (only needed when caching).
+
+    Returns:
+        Tuple[str, Optional[List[ast.stmt]], Optional[str]]: (content SHA-1, import statement nodes, error message).
+            Both the nodes and the error are None when the content matches known_digest; the nodes are None when reading or parsing failed.
+    """
+    try:
+        # 以字节读取，由 ast.parse 按 PEP 263 自行解码 (Read bytes and let ast.parse decode per PEP 263)
+        with open(path, "rb") as f:
+            src: bytes = f.read()
+    except OSError as e:
+        return "", None, str(e)
+    digest: str = hashlib.sha1(src).hexdigest() if want_digest else ""
+    if known_digest is not None and known_digest == digest:
+        return digest, None, None
+    try:
+        tree: ast.AST = ast.parse(src, filename=path)
+    except (SyntaxError, ValueError, RecursionError) as e:
+        # 语法/编码错误、源码含空字节或嵌套过深 (Syntax or encoding errors, null bytes in the source, or nesting too deep)
+        return digest, None, str(e)
+    if _IMPORT_WORD_RE.search(src) is None:
+        # 快速否定过滤：没有 import 单词的文件不可能包含导入语句，无需遍历 (Fast negative filter: a file without the word import cannot contain an import statement, so no walk is needed)
+        return digest, [], None
+    # 只遍历语句层级收集导入，无需访问每个表达式节点 (Collect imports along statement levels only, without visiting every expression node)
+    collector: _ImportCollector = _ImportCollector()
+    collector.visit(tree)
+    return digest, collector.imports, None
+
+
 # ======================================== 自定义类 ============================================
 
 
+class _ImportCollector(ast.NodeVisitor):
+    """
+    仅沿语句层级遍历AST、收集全部导入语句的访问器。
+
+    导入只能以语句形式出现，因此访问器只进入语句体字段（body、orelse、finalbody、handlers、cases），
+    从不下探到表达式节点，避免像ast.walk那样遍历模块中的每一个节点。
+
+    Attributes:
+        imports (List[ast.stmt]): 按出现顺序收集到的Import/ImportFrom节点。
+
+    ==========================================
+
+    Visitor that walks an AST along statement levels only and collects every import statement.
+
+    Imports can only appear as statements, so the visitor only enters statement-body fields (body, orelse, finalbody, handlers, cases)
+    and never descends into expression nodes, avoiding a visit of every node in the module as ast.walk does.
+
+    Attributes:
+        imports (List[ast.stmt]): Import/ImportFrom nodes collected in order of appearance.
+    """
+
+    # 可能包含语句的字段 (Fields that may contain statements)
+    _BODY_FIELDS: Tuple[str, ...] = ("body", "orelse", "finalbody", "handlers", "cases")
+
+    def __init__(self) -> None:
+        self.imports: List[ast.stmt] = []
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.append(node)
+
+    visit_ImportFrom = visit_Import
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # 只进入语句列表，跳过表达式 (Enter statement lists only, skip expressions)
+        for field in self._BODY_FIELDS:
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                for child in children:
+                    self.visit(child)
+
+
 class FileNode:
     """
     表示单个Python文件的节点类，用于存储文件元信息及其依赖关系。
@@ -37,12 +248,13 @@ class FileNode:
         module_id (str): 模块唯一标识符（相对路径，不含.py后缀，使用/分隔）。
         path (str): 文件的绝对路径。
         dotted_name (Optional[str]): 模块的点分名称（如pkg.sub.module），可能为None。
+        size (int): 文件大小（字节），在扫描阶段记录。
         imports_internal (Set[str]): 依赖的内部模块集合（存储module_id）。
         imports_external (Set[str]): 依赖的外部模块集合（存储模块名）。
         imported_by (Set[str]): 反向依赖集合（存储依赖当前模块的module_id）。
 
     Methods:
-        __init__(module_id: str, path: str, dotted_name: Optional[str]) -> None: 初始化FileNode实例。
+        __init__(module_id: str, path: str, dotted_name: Optional[str], size: Optional[int] = None) -> None: 初始化FileNode实例。
         to_md_row() -> str: 将节点信息转换为Markdown表格行字符串。
 
     Notes:
@@ -62,12 +274,13 @@ class FileNode:
         module_id (str): Unique module identifier (relative path without .py suffix, using / as separator).
         path (str): Absolute path of the file.
         dotted_name (Optional[str]): Dotted name of the module (e.g., pkg.sub.module), may be None.
+        size (int): File size in bytes, recorded during scanning.
         imports_internal (Set[str]): Set of internal dependencies (storing module_ids).
         imports_external (Set[str]): Set of external dependencies (storing module names).
         imported_by (Set[str]): Set of reverse dependencies (storing module_ids that depend on current module).
 
     Methods:
-        __init__(module_id: str, path: str, dotted_name: Optional[str]) -> None: Initialize FileNode instance.
+        __init__(module_id: str, path: str, dotted_name: Optional[str], size: Optional[int] = None) -> None: Initialize FileNode instance.
         to_md_row() -> str: Convert node information to a Markdown table row string.
 
     Notes:
@@ -76,27 +289,32 @@ class FileNode:
         Empty sets will be displayed as "-" in the Markdown table.
     """
 
-    def __init__(self, module_id: str, path: str, dotted_name: Optional[str]) -> None:
+    def __init__(
+        self, module_id: str, path: str, dotted_name: Optional[str], size: Optional[int] = None
+    ) -> None:
         """
-        初始化FileNode实例，设置模块标识、路径和点分名称，并初始化依赖集合。
+        初始化FileNode实例，设置模块标识、路径、点分名称和文件大小，并初始化依赖集合。
 
         Args:
             module_id (str): 模块唯一标识符，采用相对路径格式（不含.py后缀，用/分隔）。
-            path (str): 文件的绝对路径，用于定位文件和获取文件大小。
+            path (str): 文件的绝对路径，用于定位文件。
             dotted_name (Optional[str]): 模块的点分名称，若无法解析则为None。
+            size (Optional[int]): 扫描阶段获得的文件大小（字节），为None时通过os.path.getsize获取。
 
         ==========================================
 
-        Initialize FileNode instance, set module identifier, path and dotted name, and initialize dependency sets.
+        Initialize FileNode instance, set module identifier, path, dotted name and file size, and initialize dependency sets.
 
         Args:
             module_id (str): Unique module identifier in relative path format (without .py suffix, using / as separator).
-            path (str): Absolute path of the file, used for locating the file and getting file size.
+            path (str): Absolute path of the file, used for locating the file.
             dotted_name (Optional[str]): Dotted name of the module, None if cannot be resolved.
+            size (Optional[int]): File size in bytes obtained during scanning, fetched via os.path.getsize when None.
         """
         self.module_id: str = module_id
         self.path: str = path
         self.dotted_name: Optional[str] = dotted_name
+        self.size: int = size if size is not None else os.path.getsize(path)
         self.imports_internal: Set[str] = set()  # 内部模块依赖 (Internal module dependencies)
         self.imports_external: Set[str] = set()  # 外部模块依赖 (External module dependencies)
         self.imported_by: Set[str] = set()  # 被哪些模块依赖 (Modules that depend on this module)
@@ -106,7 +324,7 @@ class FileNode:
         将当前节点的信息转换为Markdown表格的一行，包含模块标识、点分名称、大小及依赖信息。
 
         转换逻辑：
-        - 文件大小通过os.path.getsize获取，单位为字节。
+        - 文件大小取自扫描阶段记录的size属性，单位为字节。
         - 内部依赖、外部依赖和反向依赖会排序后用逗号分隔，空集合显示为"-"。
         - 点分名称为None时显示为"-"。
 
@@ -118,20 +336,19 @@ class FileNode:
         Convert the current node's information into a row of Markdown table, including module identifier, dotted name, size and dependency information.
 
         Conversion logic:
-        - File size is obtained via os.path.getsize, in bytes.
+        - File size is taken from the size attribute recorded during scanning, in bytes.
         - Internal dependencies, external dependencies and reverse dependencies are sorted and separated by commas, empty sets are displayed as "-".
         - Dotted name is displayed as "-" when it is None.
 
         Returns:
             str: Formatted Markdown table row string.
         """
-        size: int = os.path.getsize(self.path)
         internal: str = ", ".join([f"`{m}`" for m in sorted(self.imports_internal)]) or "-"
         external: str = ", ".join([f"`{m}`" for m in sorted(self.imports_external)]) or "-"
         imported_by: str = ", ".join([f"`{m}`" for m in sorted(self.imported_by)]) or "-"
         dotted: str = self.dotted_name or "-"
 
-        return f"| `{self.module_id}` | `{dotted}` | {size} | {internal} | {external} | {imported_by} |"
+        return f"| `{self.module_id}` | `{dotted}` | {self.size} | {internal} | {external} | {imported_by} |"
 
 class DependencyAnalyzer:
     """
@@ -143,34 +360,56 @@ class DependencyAnalyzer:
     强制添加main.py对特定目录__init__.py的依赖关系。
 
     Attributes:
+        CACHE_SCHEMA (int): 导入缓存格式版本，与缓存文件中的版本不一致时整份缓存作废。
+        REPORT_FORMAT (int): Markdown报告格式版本，计入输入签名，报告格式变化后旧签名随之失效。
+        PARALLEL_MIN_FILES (int): 启用多进程解析所需的最少待解析文件数，默认64。
+        PARALLEL_MIN_BYTES (int): 启用多进程解析所需的待解析文件最小总字节数，默认4 MiB。
         root (str): 分析的项目根目录（绝对路径）。
         out_md (str): 输出Markdown报告的文件路径，默认值为"dependencies.md"。
         verbose (bool): 是否打印过程日志，默认值为True。
+        cache_path (Optional[str]): 导入解析结果的JSON缓存文件路径，为None时不使用缓存。
         module_map (Dict[str, str]): 模块标识映射表，key为module_id，value为文件绝对路径。
+        size_map (Dict[str, int]): 文件大小映射表，key为module_id，value为扫描时记录的文件大小（字节）。
+        mtime_map (Dict[str, int]): 修改时间映射表，key为module_id，value为扫描时记录的st_mtime_ns。
         dotted_map (Dict[str, str]): 点分名称映射表，key为module_id，value为模块的点分名称。
         nodes (Dict[str, FileNode]): 模块节点集合，key为module_id，value为FileNode实例。
         fixed_packages (Set[str]): 固定包目录集合，包含"drivers"、"libs"、"tasks"，放宽__init__.py检查。
+        _resolve_cache (Dict[str, Optional[str]]): 导入名解析结果缓存，build_module_map执行时清空。
+        _module_trie (dict): 按路径分量组织的module_id前缀树，键None保存该前缀对应的module_id，由build_module_map构建。
+        _sorted_ids (List[str]): 排序后的module_id列表，由build_module_map构建一次，供签名计算和报告输出复用；与nodes数量不一致时由_ensure_sorted_ids惰性重建。
+        _id_of (Dict[str, int]): module_id到其在_sorted_ids中下标的映射，整数顺序即名称顺序，供图算法使用。
+        _reverse_linked (bool): imported_by是否已与当前依赖关系同步（parse_all_files解析时顺带建立反向依赖）。
+        md_lines (Optional[List[str]]): 最近一次export_markdown写出的报告行（保留换行符），未生成报告时为None。
         forced_deps_module_ids (List[str]): 需要被main.py强制依赖的模块标识列表，对应特定__init__.py文件。
 
     Methods:
-        __init__(root: str, out_md: str = "dependencies.md", verbose: bool = True) -> None: 初始化分析器实例。
+        __init__(root: str, out_md: str = "dependencies.md", verbose: bool = True, cache_path: Optional[str] = None) -> None: 初始化分析器实例。
         scan_files() -> None: 扫描根目录收集Python文件，构建module_map。
         _compute_dotted_name(rel_noext: str, abs_path: str) -> Optional[str]: 计算模块的点分名称，处理固定包目录。
         build_module_map() -> None: 构建FileNode实例集合，填充nodes和dotted_map。
-        _parse_imports_from_ast(tree: ast.AST, cur_module_id: str) -> Tuple[Set[str], Set[str]]: 从AST树提取导入依赖，区分内部/外部模块。
-        _resolve_name_to_module(fullname: str) -> Optional[str]: 将导入名解析为项目内的module_id，优化固定包解析。
-        parse_all_files() -> None: 解析所有Python文件的AST，收集依赖关系到FileNode。
+        _resolve_imports(imports: List[ast.stmt], cur_module_id: str) -> Tuple[Set[str], Set[str]]: 解析导入语句节点，区分内部/外部模块。
+        _resolve_name_to_module(fullname: str) -> Optional[str]: 将导入名解析为项目内的module_id，按最长前缀匹配（结果会被缓存）。
+        _resolve_name_uncached(fullname: str) -> Optional[str]: 不经缓存的导入名解析逻辑。
+        _build_module_trie() -> None: 根据module_map构建module_id前缀树。
+        parse_all_files() -> None: 解析所有Python文件的AST，收集依赖关系到FileNode，并同时建立反向依赖。
+        _ensure_sorted_ids() -> List[str]: 返回与nodes同步的排序后module_id列表，必要时惰性重建。
+        _graph_signature() -> str: 计算影响导入解析结果的模块集合签名。
+        _load_cache() -> Dict[str, list]: 读取导入缓存，签名或版本不一致时返回空字典。
+        _save_cache(entries: Dict[str, list]) -> None: 原子地写入导入缓存。
+        _run_signature() -> str: 计算整次分析的输入签名。
+        _save_run_signature(run_sig: str) -> None: 将输入签名写入报告旁的.sig文件。
         _add_main_forced_deps() -> None: 强制添加main.py对特定__init__.py的依赖（若文件存在）。
-        link_reverse() -> None: 构建反向依赖关系（填充imported_by字段）。
-        find_cycles() -> List[List[str]]: 检测项目中的循环依赖，返回循环路径列表。
+        link_reverse() -> None: 构建反向依赖关系（填充imported_by字段），每次调用都从零重建。
+        find_cycles() -> List[List[str]]: 基于 Tarjan 强连通分量检测循环依赖，返回每组循环的代表路径列表。
         export_markdown(cycles: Optional[List[List[str]]] = None) -> None: 生成Markdown格式的依赖分析报告。
-        run() -> None: 一键运行完整分析流程（扫描→构建→解析→添加强制依赖→反向链接→循环检测→导出报告）。
+        run() -> None: 一键运行完整分析流程（扫描→构建→解析并反向链接→添加强制依赖→循环检测→导出报告），输入未变化时跳过。
 
     Notes:
         - module_id格式为相对路径（不含.py后缀，使用/分隔，如"drivers/uart"），确保跨平台一致性。
         - 固定包目录（drivers/libs/tasks）下的模块无需__init__.py即可生成点分名称。
         - 强制依赖仅针对main.py（module_id为"main"），目标为三个固定目录的__init__.py。
         - 解析文件时若遇到语法错误，会跳过该文件并在verbose模式下打印错误信息。
+        - 启用cache_path后，大小和修改时间未变、或内容SHA-1未变的文件直接复用缓存的解析结果；模块集合变化时缓存整体失效。
 
     ==========================================
 
@@ -182,38 +421,76 @@ class DependencyAnalyzer:
     treating them as valid packages even without __init__.py; it also supports forcing main.py to depend on specific __init__.py files.
 
     Attributes:
+        CACHE_SCHEMA (int): Import cache schema version; the whole cache is discarded when the version in the cache file differs.
+        REPORT_FORMAT (int): Markdown report format version; it is part of the input signature, so old signatures stop matching when the report format changes.
+        PARALLEL_MIN_FILES (int): Minimum number of files needing parsing before worker processes are used, default 64.
+        PARALLEL_MIN_BYTES (int): Minimum total size of the files needing parsing before worker processes are used, default 4 MiB.
         root (str): Absolute path of the project root directory for analysis.
         out_md (str): File path for output Markdown report, default is "dependencies.md".
         verbose (bool): Whether to print process logs, default is True.
+        cache_path (Optional[str]): Path of the JSON cache file for resolved imports, no cache is used when None.
         module_map (Dict[str, str]): Module identifier mapping table, key is module_id, value is absolute file path.
+        size_map (Dict[str, int]): File size mapping table, key is module_id, value is the file size in bytes recorded during scanning.
+        mtime_map (Dict[str, int]): Modification time mapping table, key is module_id, value is st_mtime_ns recorded during scanning.
         dotted_map (Dict[str, str]): Dotted name mapping table, key is module_id, value is dotted name of the module.
         nodes (Dict[str, FileNode]): Collection of module nodes, key is module_id, value is FileNode instance.
         fixed_packages (Set[str]): Set of fixed package directories, including "drivers", "libs", "tasks", relaxing __init__.py check.
+        _resolve_cache (Dict[str, Optional[str]]): Memo of resolved import names, cleared when build_module_map runs.
+        _module_trie (dict): Prefix trie of module_ids keyed by path component; the None key holds the module_id of that prefix. Built by build_module_map.
+        _sorted_ids (List[str]): Sorted module_id list, built once by build_module_map and reused by the cache signature and the report; lazily rebuilt by _ensure_sorted_ids when its length differs from nodes.
+        _id_of (Dict[str, int]): Map from module_id to its index in _sorted_ids; integer order equals name order, used by graph algorithms.
+        _reverse_linked (bool): Whether imported_by is in sync with the current dependencies (parse_all_files builds reverse links as it parses).
+        md_lines (Optional[List[str]]): Report lines (line endings kept) last written by export_markdown, None until a report is generated.
         forced_deps_module_ids (List[str]): List of module IDs that main.py must depend on, corresponding to specific __init__.py files.
 
     Methods:
-        __init__(root: str, out_md: str = "dependencies.md", verbose: bool = True) -> None: Initialize analyzer instance.
+        __init__(root: str, out_md: str = "dependencies.md", verbose: bool = True, cache_path: Optional[str] = None) -> None: Initialize analyzer instance.
         scan_files() -> None: Scan root directory to collect Python files and build module_map.
         _compute_dotted_name(rel_noext: str, abs_path: str) -> Optional[str]: Compute dotted name of module, handle fixed package directories.
         build_module_map() -> None: Build collection of FileNode instances, populate nodes and dotted_map.
-        _parse_imports_from_ast(tree: ast.AST, cur_module_id: str) -> Tuple[Set[str], Set[str]]: Extract import dependencies from AST, distinguish internal/external modules.
-        _resolve_name_to_module(fullname: str) -> Optional[str]: Resolve import name to module_id in the project, optimize fixed package parsing.
-        parse_all_files() -> None: Parse AST of all Python files, collect dependencies into FileNode.
+        _resolve_imports(imports: List[ast.stmt], cur_module_id: str) -> Tuple[Set[str], Set[str]]: Resolve import statement nodes, distinguish internal/external modules.
+        _resolve_name_to_module(fullname: str) -> Optional[str]: Resolve import name to module_id in the project, matching the longest prefix (results are memoized).
+        _resolve_name_uncached(fullname: str) -> Optional[str]: Import name resolution logic without the memo.
+        _build_module_trie() -> None: Build the module_id prefix trie from module_map.
+        parse_all_files() -> None: Parse AST of all Python files, collect dependencies into FileNode and build reverse links at the same time.
+        _ensure_sorted_ids() -> List[str]: Return the sorted module_id list in sync with nodes, lazily rebuilding it when needed.
+        _graph_signature() -> str: Compute the signature of the module set that affects import resolution.
+        _load_cache() -> Dict[str, list]: Load the import cache, returning an empty dict on signature or version mismatch.
+        _save_cache(entries: Dict[str, list]) -> None: Atomically write the import cache.
+        _run_signature() -> str: Compute the input signature of a whole analysis run.
+        _save_run_signature(run_sig: str) -> None: Write the input signature to the .sig file next to the report.
         _add_main_forced_deps() -> None: Force add main.py's dependency on specific __init__.py (if file exists).
-        link_reverse() -> None: Build reverse dependency relationships (populate imported_by field).
-        find_cycles() -> List[List[str]]: Detect cyclic dependencies in the project, return list of cycle paths.
+        link_reverse() -> None: Build reverse dependency relationships (populate imported_by field); rebuilds from scratch on every call.
+        find_cycles() -> List[List[str]]: Detect cyclic dependencies via Tarjan SCCs, return a representative cycle path per group.
         export_markdown(cycles: Optional[List[List[str]]] = None) -> None: Generate dependency analysis report in Markdown format.
-        run() -> None: One-click run of the complete analysis process (scan→build→parse→add forced deps→reverse link→cycle detect→export report).
+        run() -> None: One-click run of the complete analysis process (scan→build→parse and reverse link→add forced deps→cycle detect→export report), skipped when inputs are unchanged.
 
     Notes:
         - module_id is in relative path format (without .py suffix, using / as separator, e.g., "drivers/uart") to ensure cross-platform consistency.
         - Modules in fixed package directories (drivers/libs/tasks) can generate dotted names without __init__.py.
         - Forced dependencies only target main.py (module_id is "main"), with targets being __init__.py of three fixed directories.
         - If syntax errors are encountered during file parsing, the file will be skipped and errors printed in verbose mode.
+        - With cache_path set, files whose size and modification time, or content SHA-1, are unchanged reuse cached results; the whole cache is invalidated when the module set changes.
     """
 
+    # 导入缓存格式版本，解析逻辑变化时递增 (Import cache schema version, bump when the parsing logic changes)
+    CACHE_SCHEMA: int = 2
+    # 报告格式版本，export_markdown输出格式变化时递增 (Report format version, bump when the export_markdown output changes)
+    REPORT_FORMAT: int = 1
+    # 待解析文件不少于该数量时才启用多进程解析，否则进程启动开销得不偿失
+    # (Parse in worker processes only when at least this many files need parsing, otherwise the startup cost outweighs the gain)
+    PARALLEL_MIN_FILES: int = 64
+    # 待解析源码总量不少于该字节数时才启用多进程；解析小文件很快，进程启动和结果序列化的开销会超过收益
+    # (Use worker processes only when the sources needing parsing total at least this many bytes; small files parse
+    # quickly and process startup plus result pickling would cost more than they save)
+    PARALLEL_MIN_BYTES: int = 4 << 20
+
     def __init__(
-        self, root: str, out_md: str = "dependencies.md", verbose: bool = True
+        self,
+        root: str,
+        out_md: str = "dependencies.md",
+        verbose: bool = True,
+        cache_path: Optional[str] = None,
     ) -> None:
         """
         初始化依赖分析器实例，设置根目录、输出路径、日志模式，并初始化核心映射结构。
@@ -222,6 +499,7 @@ class DependencyAnalyzer:
             root (str): 项目根目录路径（支持相对路径或绝对路径，内部会转换为绝对路径）。
             out_md (str, optional): 输出Markdown报告的路径，默认值为"dependencies.md"。
             verbose (bool, optional): 是否启用过程日志打印，默认值为True。
+            cache_path (Optional[str], optional): 导入解析结果的JSON缓存文件路径，默认值为None（不使用缓存）。
 
         ==========================================
 
@@ -231,15 +509,31 @@ class DependencyAnalyzer:
             root (str): Project root directory path (supports relative or absolute path, converted to absolute path internally).
             out_md (str, optional): Path for output Markdown report, default is "dependencies.md".
             verbose (bool, optional): Whether to enable process log printing, default is True.
+            cache_path (Optional[str], optional): Path of the JSON cache file for resolved imports, default is None (no cache).
         """
         self.root: str = os.path.abspath(root)  # 根目录绝对路径 (Absolute path of root directory)
         self.out_md: str = out_md  # 输出 Markdown 文件路径 (Output Markdown file path)
         self.verbose: bool = verbose  # 日志打印开关 (Log printing switch)
+        self.cache_path: Optional[str] = cache_path  # 导入缓存文件路径 (Import cache file path)
         self.module_map: Dict[str, str] = {}  # module_id -> absolute path (模块标识到绝对路径的映射)
+        self.size_map: Dict[str, int] = {}  # module_id -> file size in bytes (模块标识到文件大小的映射)
+        self.mtime_map: Dict[str, int] = {}  # module_id -> mtime in ns (模块标识到修改时间的映射)
         self.dotted_map: Dict[str, str] = {}  # module_id -> dotted_name (模块标识到点分名称的映射)
         self.nodes: Dict[str, FileNode] = {}  # module_id -> FileNode (模块标识到节点实例的映射)
         # 固定的包目录，确保这些目录下的结构被正确解析 (Fixed package directories to ensure correct parsing of their structures)
         self.fixed_packages: Set[str] = {"drivers", "libs", "tasks"}
+        # 导入名解析结果缓存，同一导入名在多个模块中反复出现 (Memo of resolved import names, which recur across modules)
+        self._resolve_cache: Dict[str, Optional[str]] = {}
+        # module_id前缀树，用于最长前缀解析 (Prefix trie of module_ids for longest-prefix resolution)
+        self._module_trie: dict = {}
+        # 排序后的module_id，只排序一次 (Sorted module_ids, sorted only once)
+        self._sorted_ids: List[str] = []
+        # module_id -> 稠密整数编号 (module_id -> dense integer id)
+        self._id_of: Dict[str, int] = {}
+        # 反向依赖是否已同步 (Whether reverse dependencies are in sync)
+        self._reverse_linked: bool = False
+        # 最近写出的报告行，供可视化直接复用 (Lines of the last written report, reused directly by the visualizer)
+        self.md_lines: Optional[List[str]] = None
         # 需要被main.py依赖的特定__init__.py的module_id (Module IDs of specific __init__.py that main.py must depend on)
         self.forced_deps_module_ids: List[str] = [
             "drivers/__init__",
@@ -253,10 +547,10 @@ class DependencyAnalyzer:
         遍历项目根目录，收集所有有效Python文件并构建module_map映射表。
 
         扫描逻辑：
-        1. 排除隐藏目录（以.开头）和__pycache__目录；
+        1. 通过_iter_py_entries遍历目录树，排除隐藏目录（以.开头）和__pycache__目录；
         2. 仅保留后缀为.py的文件；
         3. 为每个文件生成module_id（相对路径，不含.py后缀，使用/分隔）；
-        4. 将module_id与文件绝对路径的映射存入module_map。
+        4. 将module_id与文件绝对路径的映射存入module_map，文件大小和修改时间分别存入size_map和mtime_map。
 
         日志输出：在verbose模式下打印扫描进度和找到的Python文件数量。
 
@@ -268,10 +562,10 @@ class DependencyAnalyzer:
         Traverse the project root directory, collect all valid Python files and build module_map.
 
         Scanning logic:
-        1. Exclude hidden directories (starting with .) and __pycache__ directory;
+        1. Walk the tree via _iter_py_entries, excluding hidden directories (starting with .) and __pycache__ directory;
         2. Only retain files with .py suffix;
         3. Generate module_id for each file (relative path, without .py suffix, using / as separator);
-        4. Store the mapping of module_id to absolute file path in module_map.
+        4. Store the mapping of module_id to absolute file path in module_map, and the file size and modification time in size_map and mtime_map.
 
         Log output: Print scanning progress and number of found Python files in verbose mode.
 
@@ -281,20 +575,19 @@ class DependencyAnalyzer:
         if self.verbose:
             print(f"[scan] scanning {self.root} ...")
         root_len: int = len(self.root.rstrip(os.sep)) + 1
-        for dirpath, dirnames, filenames in os.walk(self.root):
-            # 排除 __pycache__ 等不需要的目录 (Exclude unwanted directories like __pycache__)
-            dirnames[:] = [
-                d for d in dirnames if not d.startswith(".") and d != "__pycache__"
-            ]
-            for fname in filenames:
-                if not fname.endswith(".py"):
-                    continue
-                full: str = os.path.join(dirpath, fname)
-                rel: str = full[root_len:]  # 相对路径（含文件名）(Relative path including filename)
-                # module_id 使用 unix 风格分隔符，不含 .py (module_id uses Unix-style separator, without .py)
-                rel_noext: str = rel[:-3].replace(os.sep, "/")
-                # 记录 module map (Record module map)
-                self.module_map[rel_noext] = full
+        module_map: Dict[str, str] = self.module_map
+        size_map: Dict[str, int] = self.size_map
+        mtime_map: Dict[str, int] = self.mtime_map
+        for entry in _iter_py_entries(self.root):
+            full: str = entry.path
+            rel: str = full[root_len:]  # 相对路径（含文件名）(Relative path including filename)
+            # module_id 使用 unix 风格分隔符，不含 .py (module_id uses Unix-style separator, without .py)
+            rel_noext: str = rel[:-3].replace(os.sep, "/")
+            # 记录 module map 及文件大小 (Record module map and file size)
+            st: os.stat_result = entry.stat()
+            module_map[rel_noext] = full
+            size_map[rel_noext] = st.st_size
+            mtime_map[rel_noext] = st.st_mtime_ns
         if self.verbose:
             print(f"[scan] found {len(self.module_map)} python files")
 
@@ -383,9 +676,21 @@ class DependencyAnalyzer:
         Returns:
             None
         """
-        for module_id, abs_path in sorted(self.module_map.items()):
+        # 模块集合在此确定，清空旧的导入名解析缓存并重建前缀树 (The module set is settled here, drop stale memo entries and rebuild the trie)
+        self._resolve_cache.clear()
+        self._build_module_trie()
+        self._sorted_ids = sorted(self.module_map)
+        self._id_of = {module_id: i for i, module_id in enumerate(self._sorted_ids)}
+        self._reverse_linked = False
+        for module_id in self._sorted_ids:
+            abs_path: str = self.module_map[module_id]
             dotted: Optional[str] = self._compute_dotted_name(module_id, abs_path)
-            node: FileNode = FileNode(module_id=module_id, path=abs_path, dotted_name=dotted)
+            node: FileNode = FileNode(
+                module_id=module_id,
+                path=abs_path,
+                dotted_name=dotted,
+                size=self.size_map.get(module_id),
+            )
 
             # 对于固定包的__init__.py，确保能被正确识别 (Ensure correct identification of __init__.py in fixed packages)
             parts: List[str] = module_id.split("/")
@@ -404,12 +709,37 @@ class DependencyAnalyzer:
             self.nodes[module_id] = node
             self.dotted_map[module_id] = node.dotted_name
 
+    def _ensure_sorted_ids(self) -> List[str]:
+        """
+        内部方法：返回排序后的module_id列表，必要时按当前nodes惰性重建_sorted_ids与_id_of。
+
+        _sorted_ids通常由build_module_map构建；若调用方绕过build_module_map直接填充或增删了nodes，
+        两者数量不一致时在此重新排序，避免find_cycles、export_markdown和签名计算静默漏掉模块。
+
+        Returns:
+            List[str]: 与nodes同步的排序后module_id列表。
+
+        ==========================================
+
+        Internal method: Return the sorted module_id list, lazily rebuilding _sorted_ids and _id_of from the current nodes when needed.
+
+        _sorted_ids is normally built by build_module_map; if a caller fills nodes directly or adds/removes entries without it,
+        the lengths differ and the ids are sorted again here, so find_cycles, export_markdown and the signatures never silently miss modules.
+
+        Returns:
+            List[str]: Sorted module_id list in sync with nodes.
+        """
+        if len(self._sorted_ids) != len(self.nodes):
+            self._sorted_ids = sorted(self.nodes)
+            self._id_of = {module_id: i for i, module_id in enumerate(self._sorted_ids)}
+        return self._sorted_ids
+
     # ---------- 解析 AST，收集导入 ----------
-    def _parse_imports_from_ast(
-        self, tree: ast.AST, cur_module_id: str
+    def _resolve_imports(
+        self, imports: List[ast.stmt], cur_module_id: str
     ) -> Tuple[Set[str], Set[str]]:
         """
-        内部方法：从Python抽象语法树（AST）中提取导入语句，区分内部依赖和外部依赖。
+        内部方法：解析由_read_imports收集的导入语句节点，区分内部依赖和外部依赖。
 
         支持解析的导入类型：
         1. 绝对导入：`import a.b as c` 和 `from a.b import c`；
@@ -421,7 +751,7 @@ class DependencyAnalyzer:
         - 外部依赖：无法解析或属于第三方库的导入。
 
         Args:
-            tree (ast.AST): 解析后的Python抽象语法树。
+            imports (List[ast.stmt]): 文件中的Import/ImportFrom语句节点列表。
             cur_module_id (str): 当前解析文件的module_id，用于解析相对导入。
 
         Returns:
@@ -429,7 +759,7 @@ class DependencyAnalyzer:
 
         ==========================================
 
-        Internal method: Extract import statements from Python Abstract Syntax Tree (AST), distinguish internal and external dependencies.
+        Internal method: Resolve the import statement nodes collected by _read_imports, distinguish internal and external dependencies.
 
         Supported import types:
         1. Absolute import: `import a.b as c` and `from a.b import c`;
@@ -441,7 +771,7 @@ class DependencyAnalyzer:
         - External dependencies: Imports that cannot be resolved or belong to third-party libraries.
 
         Args:
-            tree (ast.AST): Parsed Python abstract syntax tree.
+            imports (List[ast.stmt]): Import/ImportFrom statement nodes of the file.
             cur_module_id (str): module_id of the current parsed file, used to parse relative imports.
 
         Returns:
@@ -452,7 +782,7 @@ class DependencyAnalyzer:
         cur_node: Optional[FileNode] = self.nodes.get(cur_module_id)
         cur_dotted: Optional[str] = cur_node.dotted_name if cur_node else None
 
-        for node in ast.walk(tree):
+        for node in imports:
             # 处理 `import a.b as c` (Handle `import a.b as c`)
             if isinstance(node, ast.Import):
                 for alias in node.names:
@@ -559,10 +889,8 @@ class DependencyAnalyzer:
         """
         内部方法：将导入名（点分格式，如"drivers.uart"）解析为项目内的module_id。
 
-        解析优先级（从高到低）：
-        1. 固定包前缀匹配：优先解析fixed_packages下的模块，点分转路径格式；
-        2. 通用前缀匹配：拆分导入名为多级前缀，尝试匹配module_id或包的__init__.py；
-        3. 固定包顶层匹配：直接匹配fixed_packages中的包（如"drivers"→"drivers/__init__"）。
+        解析规则：在module_id前缀树中按导入名的各级分量查找，返回最长的可匹配前缀；
+        同一前缀上模块文件优先于包的__init__.py（如"drivers"→"drivers/__init__"，"drivers.uart.X"→"drivers/uart"）。
 
         Args:
             fullname (str): 导入名（点分格式，如"a.b.c"或"drivers"）。
@@ -574,10 +902,8 @@ class DependencyAnalyzer:
 
         Internal method: Resolve import name (dotted format, e.g., "drivers.uart") to module_id in the project.
 
-        Parsing priority (from high to low):
-        1. Fixed package prefix matching: Prioritize parsing modules under fixed_packages, convert dotted to path format;
-        2. General prefix matching: Split import name into multi-level prefixes, try to match module_id or package's __init__.py;
-        3. Fixed package top-level matching: Directly match packages in fixed_packages (e.g., "drivers"→"drivers/__init__").
+        Resolution rule: walk the components of the import name through the module_id prefix trie and return the longest matching prefix;
+        on the same prefix a module file wins over a package's __init__.py (e.g., "drivers"→"drivers/__init__", "drivers.uart.X"→"drivers/uart").
 
         Args:
             fullname (str): Import name (dotted format, e.g., "a.b.c" or "drivers").
@@ -587,45 +913,78 @@ class DependencyAnalyzer:
         """
         if not fullname:
             return None
+        cache: Dict[str, Optional[str]] = self._resolve_cache
+        if fullname in cache:
+            return cache[fullname]
+        resolved: Optional[str] = self._resolve_name_uncached(fullname)
+        cache[fullname] = resolved
+        return resolved
+
+    def _resolve_name_uncached(self, fullname: str) -> Optional[str]:
+        """
+        内部方法：_resolve_name_to_module的实际解析逻辑，不经过缓存。
+
+        Args:
+            fullname (str): 非空的导入名（点分格式）。
+
+        Returns:
+            Optional[str]: 匹配到的module_id，无匹配则返回None。
+
+        ==========================================
+
+        Internal method: The actual resolution logic of _resolve_name_to_module, bypassing the memo.
+
+        Args:
+            fullname (str): Non-empty import name (dotted format).
+
+        Returns:
+            Optional[str]: Matched module_id, None if no match.
+        """
+        # 逐级下行前缀树，记录最后一个有模块的前缀，无需重复拼接路径字符串
+        # (Walk down the trie component by component, remembering the last prefix with a module, without rebuilding path strings)
+        node: Optional[dict] = self._module_trie
+        found: Optional[str] = None
+        for part in fullname.split("."):
+            node = node.get(part)
+            if node is None:
+                break
+            hit: Optional[str] = node.get(None)
+            if hit is not None:
+                found = hit
+        return found
+
+    def _build_module_trie(self) -> None:
+        """
+        内部方法：根据module_map构建按路径分量组织的前缀树_module_trie。
+
+        每个module_id沿其路径分量插入，末端节点的None键记录该module_id；
+        包的__init__.py同时登记到包目录节点上，但不覆盖同名模块文件（如"a/b"优先于"a/b/__init__"）。
+
+        Returns:
+            None
 
-        # 首先检查是否是固定包下的模块 (First check if it's a module under fixed packages)
-        for pkg in self.fixed_packages:
-            if fullname.startswith(f"{pkg}."):
-                # 将点分表示转换为路径表示 (Convert dotted representation to path representation)
-                rel_path: str = fullname.replace(f"{pkg}.", f"{pkg}/").replace(".", "/")
-                # 检查是否存在该模块 (Check if the module exists)
-                if rel_path in self.module_map:
-                    return rel_path
-                # 检查是否存在该包的__init__.py (Check if __init__.py of the package exists)
-                init_path: str = f"{rel_path}/__init__"
-                if init_path in self.module_map:
-                    return init_path
-
-        # 通用解析逻辑 (General parsing logic)
-        parts: List[str] = fullname.split(".")
-        candidates: List[str] = []
-        for cut in range(len(parts), 0, -1):
-            left: List[str] = parts[:cut]
-            rel_path: str = "/".join(left)
-            candidates.append(rel_path)
-
-        # 尝试匹配候选 (Try to match candidates)
-        for cand in candidates:
-            if cand in self.module_map:
-                return cand
-            # 检查是否为包的__init__.py (Check if it's __init__.py of the package)
-            alt: str = cand + "/__init__"
-            if alt in self.module_map:
-                return alt
-
-        # 特别处理固定包的顶层导入 (Special handling of top-level imports for fixed packages)
-        if fullname in self.fixed_packages:
-            # 检查该包的__init__.py (Check if __init__.py of the package exists)
-            init_path: str = f"{fullname}/__init__"
-            if init_path in self.module_map:
-                return init_path
-
-        return None
+        ==========================================
+
+        Internal method: Build the prefix trie _module_trie from module_map, keyed by path component.
+
+        Each module_id is inserted along its path components, and the None key of the final node records the module_id;
+        a package's __init__.py is also registered on the package directory node, without overriding a module file of the same name (e.g. "a/b" wins over "a/b/__init__").
+
+        Returns:
+            None
+        """
+        trie: dict = {}
+        for module_id in self.module_map:
+            parts: List[str] = module_id.split("/")
+            parent: dict = trie
+            node: dict = trie
+            for part in parts:
+                parent = node
+                node = node.setdefault(part, {})
+            node[None] = module_id
+            if len(parts) > 1 and parts[-1] == "__init__":
+                parent.setdefault(None, module_id)
+        self._module_trie = trie
 
     def parse_all_files(self) -> None:
         """
@@ -633,10 +992,15 @@ class DependencyAnalyzer:
 
         处理流程：
         1. 遍历nodes中的每个FileNode实例；
-        2. 读取文件内容并解析为AST（遇到语法错误则跳过并打印日志）；
-        3. 调用_parse_imports_from_ast提取内部/外部依赖；
+        2. 以字节读取文件内容并解析为AST，源码编码由ast.parse按PEP 263声明处理（遇到语法错误则跳过并打印日志）；
+        3. 调用_resolve_imports将导入语句解析为内部/外部依赖；
         4. 将依赖关系写入FileNode的imports_internal和imports_external字段。
 
+        空文件（如空的__init__.py）既无导入也不会有语法错误，直接记为无依赖，不再读取和解析。
+        设置cache_path时，大小和修改时间均未变化的文件直接复用缓存中的解析结果；仅修改时间变化时再比较内容的SHA-1，
+        内容一致同样复用缓存，解析完成后写回缓存。
+        需要读取的文件不少于PARALLEL_MIN_FILES个且总大小不少于PARALLEL_MIN_BYTES时，读取和AST解析由ProcessPoolExecutor分发到多个进程执行，导入名解析仍在主进程完成。
+
         日志输出：在verbose模式下打印解析进度、错误信息和结果。
 
         Returns:
@@ -648,10 +1012,15 @@ class DependencyAnalyzer:
 
         Processing flow:
         1. Traverse each FileNode instance in nodes;
-        2. Read file content and parse to AST (skip and print log if syntax error occurs);
-        3. Call _parse_imports_from_ast to extract internal/external dependencies;
+        2. Read file content as bytes and parse to AST, letting ast.parse handle the source encoding per PEP 263 (skip and print log if syntax error occurs);
+        3. Call _resolve_imports to resolve the import statements into internal/external dependencies;
         4. Write dependencies to imports_internal and imports_external fields of FileNode.
 
+        Empty files (e.g. empty __init__.py) have neither imports nor syntax errors; they are recorded as having no dependencies without being read or parsed.
+        When cache_path is set, files whose size and modification time are unchanged reuse the cached result; otherwise the content SHA-1 is compared,
+        and files with unchanged content reuse the cached result as well. The cache is written back afterwards.
+        When at least PARALLEL_MIN_FILES files totalling at least PARALLEL_MIN_BYTES need reading, reading and AST parsing are spread over processes with a ProcessPoolExecutor, while import names are still resolved in the main process.
+
         Log output: Print parsing progress, error messages and results in verbose mode.
 
         Returns:
@@ -659,18 +1028,265 @@ class DependencyAnalyzer:
         """
         if self.verbose:
             print("[parse] parsing files and resolving imports ...")
-        for module_id, node in self.nodes.items():
+        use_cache: bool = bool(self.cache_path)
+        cached: Dict[str, list] = self._load_cache()
+        # 本次运行的缓存条目：module_id -> [size, mtime_ns, sha1, internal, external]
+        # (Cache entries of this run: module_id -> [size, mtime_ns, sha1, internal, external])
+        entries: Dict[str, list] = {}
+        hits: int = 0
+        nodes: Dict[str, FileNode] = self.nodes
+        # 反向依赖在解析的同时建立，先一次性换上新的空集合以便重复运行
+        # (Reverse links are built while parsing; swap in fresh empty sets once first so re-runs start clean)
+        for node in nodes.values():
+            node.imported_by = set()
+
+        def link(module_id: str, internal: Set[str]) -> None:
+            # 把 module_id 登记到其每个内部依赖的 imported_by 中 (Register module_id in the imported_by set of each internal dependency)
+            for tgt in internal:
+                tgt_node: Optional[FileNode] = nodes.get(tgt)
+                if tgt_node is not None:
+                    tgt_node.imported_by.add(module_id)
+
+        # 需要读取文件的模块及其缓存条目 (Modules whose file has to be read, with their cache entries)
+        pending: List[Tuple[str, FileNode, Optional[list]]] = []
+        for module_id, node in nodes.items():
+            # 空文件没有导入，也不可能有语法错误，跳过读取和解析；非空的小文件仍需解析以报告语法错误
+            # (Empty files have no imports and cannot have syntax errors, skip reading and parsing; small non-empty files
+            # are still parsed so their syntax errors are reported)
+            if node.size == 0:
+                node.imports_internal = set()
+                node.imports_external = set()
+                continue
+            entry: Optional[list] = cached.get(module_id)
+            if entry is not None and entry[0] == node.size and entry[1] == self.mtime_map.get(module_id):
+                # 大小和修改时间均未变化，无需读取文件即可复用缓存结果
+                # (Size and modification time unchanged, reuse the cached result without reading the file)
+                node.imports_internal = set(entry[3])
+                node.imports_external = set(entry[4])
+                link(module_id, node.imports_internal)
+                entries[module_id] = entry
+                hits += 1
+                continue
+            pending.append((module_id, node, entry))
+
+        paths: List[str] = [node.path for _, node, _ in pending]
+        known: List[Optional[str]] = [entry[2] if entry is not None else None for _, _, entry in pending]
+        results: Optional[list] = None
+        size_map: Dict[str, int] = self.size_map
+        if (
+            len(pending) >= self.PARALLEL_MIN_FILES
+            and sum(size_map.get(module_id, 0) for module_id, _, _ in pending) >= self.PARALLEL_MIN_BYTES
+            and (os.cpu_count() or 1) > 1
+        ):
+            # 读取与ast.parse是CPU密集的部分，分发到多个进程；工作进程只返回导入语句节点
+            # (Reading and ast.parse are the CPU-bound part, spread them over processes; workers only return import nodes)
             try:
-                with open(node.path, "r", encoding="utf-8") as f:
-                    src: str = f.read()
-                tree: ast.AST = ast.parse(src, filename=node.path)
-            except Exception as e:
+                # 仅在需要并行时导入，避免普通导入本模块时加载 multiprocessing (Imported only when needed, so importing this module does not load multiprocessing)
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor() as ex:
+                    results = list(ex.map(_read_imports, paths, known, [use_cache] * len(paths), chunksize=32))
+            except (OSError, RuntimeError, NotImplementedError) as e:
+                # 无法创建进程池（如受限环境）时退回串行解析 (Fall back to serial parsing when a process pool cannot be created, e.g. in restricted environments)
+                if self.verbose:
+                    print(f"[parse] process pool unavailable, parsing serially: {e}")
+        if results is None:
+            results = list(map(_read_imports, paths, known, [use_cache] * len(paths)))
+
+        for (module_id, node, entry), (digest, imports, error) in zip(pending, results):
+            mtime: Optional[int] = self.mtime_map.get(module_id)
+            if error is not None:
                 if self.verbose:
-                    print(f"[parse] failed to parse {node.path}: {e}")
+                    print(f"[parse] failed to parse {node.path}: {error}")
+                link(module_id, node.imports_internal)
                 continue
-            internal, external = self._parse_imports_from_ast(tree, module_id)
+            if imports is None:
+                # 仅修改时间变化（如 touch、重新检出），内容哈希一致，复用缓存结果并刷新修改时间
+                # (Only the modification time changed (e.g. touch, re-checkout) and the content hash matches: reuse and refresh the mtime)
+                node.imports_internal = set(entry[3])
+                node.imports_external = set(entry[4])
+                link(module_id, node.imports_internal)
+                if mtime is not None:
+                    entries[module_id] = [node.size, mtime, digest, entry[3], entry[4]]
+                hits += 1
+                continue
+            internal, external = self._resolve_imports(imports, module_id)
             node.imports_internal = internal
             node.imports_external = external
+            link(module_id, internal)
+            if use_cache and mtime is not None:
+                entries[module_id] = [node.size, mtime, digest, sorted(internal), sorted(external)]
+        self._reverse_linked = True
+        if use_cache:
+            if self.verbose:
+                print(f"[cache] reused {hits} cached results, parsed {len(entries) - hits} files")
+            self._save_cache(entries)
+
+    # ---------- 导入缓存 ----------
+    def _graph_signature(self) -> str:
+        """
+        内部方法：计算影响导入解析结果的模块集合签名。
+
+        导入解析结果依赖于全部module_id、各模块的点分名称以及固定包目录，
+        任何一项变化（如新增/删除文件）都会使签名改变，从而使整份缓存失效。
+
+        Returns:
+            str: 模块集合的SHA-1十六进制签名。
+
+        ==========================================
+
+        Internal method: Compute the signature of the module set that affects import resolution.
+
+        Resolved imports depend on all module_ids, the dotted name of each module and the fixed package directories;
+        any change (e.g., files added or removed) changes the signature and thus invalidates the whole cache.
+
+        Returns:
+            str: SHA-1 hex signature of the module set.
+        """
+        h = hashlib.sha1()
+        h.update("\0".join(sorted(self.fixed_packages)).encode("utf-8"))
+        for module_id in self._ensure_sorted_ids():
+            h.update(f"\n{module_id}\0{self.nodes[module_id].dotted_name or ''}".encode("utf-8"))
+        return h.hexdigest()
+
+    def _load_cache(self) -> Dict[str, list]:
+        """
+        内部方法：读取导入缓存文件。
+
+        缓存文件不存在、无法解析，或其格式版本、Python版本、模块集合签名与当前不一致时，返回空字典。
+
+        Returns:
+            Dict[str, list]: 缓存条目，key为module_id，value为[size, mtime_ns, sha1, internal, external]。
+
+        ==========================================
+
+        Internal method: Load the import cache file.
+
+        Returns an empty dict when the cache file is missing or unreadable, or when its schema version,
+        Python version or module set signature differs from the current one.
+
+        Returns:
+            Dict[str, list]: Cache entries, key is module_id, value is [size, mtime_ns, sha1, internal, external].
+        """
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.CACHE_SCHEMA
+            or data.get("py") != sys.version
+            or data.get("graph") != self._graph_signature()
+        ):
+            return {}
+        return data.get("entries") or {}
+
+    def _save_cache(self, entries: Dict[str, list]) -> None:
+        """
+        内部方法：写入导入缓存文件。
+
+        先写入同目录下的临时文件，再通过os.replace原子替换，避免并发运行或中断时留下损坏的缓存。
+        写入失败时仅在verbose模式下打印提示，不影响分析流程。
+
+        Args:
+            entries (Dict[str, list]): 缓存条目，key为module_id，value为[size, mtime_ns, sha1, internal, external]。
+
+        Returns:
+            None
+
+        ==========================================
+
+        Internal method: Write the import cache file.
+
+        Writes to a temporary file in the same directory first, then swaps it in atomically with os.replace,
+        so concurrent or interrupted runs never leave a corrupted cache. Write failures are only reported in verbose mode
+        and do not affect the analysis.
+
+        Args:
+            entries (Dict[str, list]): Cache entries, key is module_id, value is [size, mtime_ns, sha1, internal, external].
+
+        Returns:
+            None
+        """
+        if not self.cache_path:
+            return
+        data: Dict[str, object] = {
+            "version": self.CACHE_SCHEMA,
+            "py": sys.version,
+            "graph": self._graph_signature(),
+            "entries": entries,
+        }
+        tmp_path: str = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            if self.verbose:
+                print(f"[cache] failed to write {self.cache_path}: {e}")
+
+    def _run_signature(self) -> str:
+        """
+        内部方法：计算整次分析的输入签名，用于判断报告是否需要重新生成。
+
+        签名覆盖缓存格式版本、报告格式版本、Python版本、根目录、固定包与强制依赖配置，以及每个文件的module_id、大小和修改时间（纳秒），
+        任何文件新增、删除或修改都会使签名改变。
+
+        Returns:
+            str: 输入签名的SHA-1十六进制字符串。
+
+        ==========================================
+
+        Internal method: Compute the input signature of a whole analysis run, used to decide whether the report must be regenerated.
+
+        The signature covers the cache schema version, the report format version, the Python version, the root directory, the fixed package and forced dependency
+        settings, and the module_id, size and modification time (ns) of every file; adding, removing or modifying any file changes it.
+
+        Returns:
+            str: SHA-1 hex string of the input signature.
+        """
+        h = hashlib.sha1()
+        h.update(f"{self.CACHE_SCHEMA}\0{self.REPORT_FORMAT}\0{sys.version}\0{os.path.abspath(self.root)}".encode("utf-8"))
+        h.update("\0".join(sorted(self.fixed_packages)).encode("utf-8"))
+        h.update("\0".join(self.forced_deps_module_ids).encode("utf-8"))
+        size_map: Dict[str, int] = self.size_map
+        mtime_map: Dict[str, int] = self.mtime_map
+        for module_id in self._ensure_sorted_ids():
+            h.update(f"\n{module_id}:{size_map.get(module_id)}:{mtime_map.get(module_id)}".encode("utf-8"))
+        return h.hexdigest()
+
+    def _save_run_signature(self, run_sig: str) -> None:
+        """
+        内部方法：将本次分析的输入签名写入报告旁的.sig文件（临时文件+os.replace原子替换）。
+
+        Args:
+            run_sig (str): _run_signature计算的输入签名。
+
+        Returns:
+            None
+
+        ==========================================
+
+        Internal method: Write the input signature of this run to the .sig file next to the report (temporary file plus atomic os.replace).
+
+        Args:
+            run_sig (str): Input signature computed by _run_signature.
+
+        Returns:
+            None
+        """
+        sig_path: str = f"{self.out_md}.sig"
+        tmp_path: str = f"{sig_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(run_sig)
+            os.replace(tmp_path, sig_path)
+        except OSError as e:
+            if self.verbose:
+                print(f"[cache] failed to write {sig_path}: {e}")
 
     # ---------- 强制添加main.py依赖 ----------
     def _add_main_forced_deps(self) -> None:
@@ -711,20 +1327,24 @@ class DependencyAnalyzer:
             return
 
         main_node: FileNode = self.nodes[main_module_id]
-        added_count: int = 0
-
-        # 遍历需要强制依赖的module_id (Traverse module_ids that need forced dependencies)
-        for dep_module_id in self.forced_deps_module_ids:
-            # 检查目标__init__.py是否存在 (Check if target __init__.py exists)
-            if dep_module_id in self.nodes:
-                # 避免重复添加依赖 (Avoid duplicate dependencies)
-                if dep_module_id not in main_node.imports_internal:
-                    main_node.imports_internal.add(dep_module_id)
-                    added_count += 1
-                    if self.verbose:
-                        print(
-                            f"[force-dep] added {dep_module_id} as dependency of {main_module_id}"
-                        )
+
+        # 一次集合运算：目标存在且尚未被依赖 (One set expression: targets that exist and are not yet dependencies)
+        to_add: Set[str] = (
+            set(self.forced_deps_module_ids) & self.nodes.keys()
+        ) - main_node.imports_internal
+        main_node.imports_internal.update(to_add)
+        # 同步维护反向依赖，无需再次全量重建 (Keep reverse links in sync so no full rebuild is needed)
+        for dep_module_id in to_add:
+            self.nodes[dep_module_id].imported_by.add(main_module_id)
+        added_count: int = len(to_add)
+
+        if self.verbose:
+            # 按配置顺序输出日志 (Log in configured order)
+            for dep_module_id in self.forced_deps_module_ids:
+                if dep_module_id in to_add:
+                    print(
+                        f"[force-dep] added {dep_module_id} as dependency of {main_module_id}"
+                    )
 
         if self.verbose and added_count > 0:
             print(
@@ -741,9 +1361,12 @@ class DependencyAnalyzer:
         构建反向依赖关系，填充每个FileNode的imported_by字段。
 
         处理流程：
-        1. 清空所有FileNode的imported_by字段（避免残留数据）；
-        2. 遍历每个模块的正向依赖（imports_internal），为目标模块的imported_by添加当前模块ID；
-        3. 包含强制添加的依赖关系，确保反向依赖完整性。
+        1. 为每个模块预先创建新的反向依赖集合（替代清空旧数据，避免残留）；
+        2. 单次遍历所有模块：将集合挂到imported_by，同时遍历其正向依赖（imports_internal），为目标模块的集合添加当前模块ID；
+        3. 包含强制添加的依赖关系，确保反向依赖完整性；可重复调用，每次都从零重建。
+
+        parse_all_files在解析时已顺带建立反向依赖，_add_main_forced_deps也会同步维护，run()因此不再调用本方法；
+        显式调用时总是先清除_reverse_linked再完整重建，因此手动修改imports_internal后调用即可刷新imported_by。
 
         作用：支持后续的被引用次数统计和循环依赖检测。
 
@@ -755,94 +1378,165 @@ class DependencyAnalyzer:
         Build reverse dependency relationships and populate the imported_by field of each FileNode.
 
         Processing flow:
-        1. Clear the imported_by field of all FileNodes (avoid residual data);
-        2. Traverse the forward dependencies (imports_internal) of each module, add current module ID to the imported_by of the target module;
-        3. Include forced dependencies to ensure the integrity of reverse dependencies.
+        1. Pre-create a fresh reverse dependency set for every module (instead of clearing old data, avoiding residue);
+        2. Traverse all modules once: attach the set as imported_by and walk its forward dependencies (imports_internal), adding the current module ID to each target's set;
+        3. Include forced dependencies to ensure the integrity of reverse dependencies; safe to call repeatedly, rebuilding from scratch each time.
+
+        parse_all_files already builds the reverse links while parsing and _add_main_forced_deps keeps them in sync, so run() no longer calls this method;
+        an explicit call always clears _reverse_linked and rebuilds in full, so calling it after editing imports_internal refreshes imported_by.
 
         Function: Support subsequent statistics of referenced times and cyclic dependency detection.
 
         Returns:
             None
         """
-        # 清空 imported_by (Clear imported_by)
-        for node in self.nodes.values():
-            node.imported_by = set()
-        # 构造反向关系（包含强制添加的依赖）(Build reverse relationships including forced dependencies)
-        for module_id, node in self.nodes.items():
+        # 显式调用总是重建，先标记为未同步 (An explicit call always rebuilds, so mark as out of sync first)
+        self._reverse_linked = False
+        nodes: Dict[str, FileNode] = self.nodes
+        # 预先为每个模块创建新的反向集合，替代逐个清空 (Pre-create a fresh reverse set per module instead of clearing each one)
+        rev: Dict[str, Set[str]] = {module_id: set() for module_id in nodes}
+        # 单次遍历：挂接反向集合并填充（包含强制添加的依赖）
+        # (Single pass: attach the reverse set and fill it, including forced dependencies)
+        for module_id, node in nodes.items():
+            node.imported_by = rev[module_id]
             for tgt in node.imports_internal:
-                if tgt in self.nodes:
-                    self.nodes[tgt].imported_by.add(module_id)
+                tgt_rev: Optional[Set[str]] = rev.get(tgt)
+                if tgt_rev is not None:
+                    tgt_rev.add(module_id)
+        self._reverse_linked = True
 
     def find_cycles(self) -> List[List[str]]:
         """
-        检测项目中的循环依赖，返回所有循环路径的列表。
+        检测项目中的循环依赖，返回每组循环依赖的代表性循环路径列表。
 
-        实现原理：采用DFS（深度优先搜索）三色标记法：
-        - WHITE：未访问；
-        - GRAY：正在访问（处于当前DFS路径中）；
-        - BLACK：已访问完毕。
-        当搜索到GRAY节点时，说明找到循环路径，回溯构建完整循环。
+        实现原理：采用迭代式 Tarjan 强连通分量（SCC）算法，单次 O(V+E) 遍历找出全部强连通分量：
+        - 为每个节点分配访问序号 index 与可回溯的最小序号 low，使用显式栈代替递归，不受递归深度限制；
+        - 节点的 low 等于 index 时，SCC 栈中该节点及其上方的节点构成一个强连通分量；
+        - 节点数大于1的分量，或带自环的单节点分量，即为一组循环依赖。
 
-        去重处理：通过字符串化循环路径（如"a->b->c->a"）避免重复记录。
+        代表路径：每个分量从名称最小的成员出发，在分量内部做广度优先搜索，取回到该成员的最短循环作为报告路径，
+        因此每组循环依赖恰好报告一次，共享节点的多个循环不会被遗漏或重复列出。
+        为降低解释器开销，算法复用build_module_map按名称顺序分配的整数编号，仅在整数邻接表和定长数组上运行。
 
         日志输出：在verbose模式下打印检测进度和找到的循环数量。
 
         Returns:
-            List[List[str]]: 循环路径列表，每个子列表为一个循环（如["a", "b", "c", "a"]）。
+            List[List[str]]: 循环路径列表，每个子列表为一个循环（如["a", "b", "c", "a"]），按起始模块名排序。
 
         ==========================================
 
-        Detect cyclic dependencies in the project and return a list of all cycle paths.
+        Detect cyclic dependencies in the project and return a representative cycle path for each group of cyclic dependencies.
 
-        Implementation principle: DFS (Depth-First Search) three-color marking method:
-        - WHITE: Unvisited;
-        - GRAY: Being visited (in the current DFS path);
-        - BLACK: Visited completely.
-        When a GRAY node is searched, it indicates a cycle path is found, and backtracking is performed to build the complete cycle.
+        Implementation principle: an iterative Tarjan strongly connected component (SCC) algorithm finds all SCCs in a single O(V+E) pass:
+        - Each node gets a visit index and a low-link (smallest reachable index); an explicit stack replaces recursion, so the recursion limit does not apply;
+        - When a node's low-link equals its index, it and the nodes above it on the SCC stack form one strongly connected component;
+        - Components with more than one node, or single-node components with a self-loop, are one group of cyclic dependencies.
 
-        Deduplication: Avoid duplicate records by stringifying cycle paths (e.g., "a->b->c->a").
+        Representative path: each component is searched breadth-first from its smallest-named member, restricted to the component,
+        and the shortest cycle back to that member is reported. Every group of cyclic dependencies is thus reported exactly once,
+        and cycles sharing nodes are neither missed nor listed repeatedly.
+        To cut interpreter overhead, the algorithm reuses the integer ids assigned in name order by build_module_map and only walks integer adjacency lists and fixed-size arrays.
 
         Log output: Print detection progress and number of found cycles in verbose mode.
 
         Returns:
-            List[List[str]]: List of cycle paths, each sublist is a cycle (e.g., ["a", "b", "c", "a"]).
+            List[List[str]]: List of cycle paths, each sublist is a cycle (e.g., ["a", "b", "c", "a"]), sorted by starting module name.
         """
         if self.verbose:
             print("[cycles] detecting cycles ...")
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color: Dict[str, int] = {m: WHITE for m in self.nodes}
-        parent: Dict[str, Optional[str]] = {}
+        # 复用 build_module_map 分配的整数编号，算法仅在整数邻接表上运行；编号顺序即名称顺序
+        # (Reuse the integer ids assigned by build_module_map so the algorithm only walks integer adjacency lists; id order is name order)
+        nodes: Dict[str, FileNode] = self.nodes
+        names: List[str] = self._ensure_sorted_ids()
+        index_of: Dict[str, int] = self._id_of
+        succ: List[List[int]] = [
+            [index_of[v] for v in nodes[m].imports_internal if v in index_of]
+            for m in names
+        ]
+        n: int = len(names)
+
+        # Tarjan 状态：访问序号（-1 表示未访问）、low 值、入栈标记与 SCC 栈，均为定长数组
+        # (Tarjan state: visit index (-1 = unvisited), low-link, on-stack flags and the SCC stack, all fixed-size arrays)
+        index: array = array("i", [-1]) * n
+        low: array = array("i", [0]) * n
+        on_stack: bytearray = bytearray(n)
+        scc_stack: List[int] = []
+        sccs: List[List[int]] = []
+        counter: int = 0
+
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack[root] = 1
+            # DFS 工作栈保存 (节点, 后继迭代器) (DFS work stack holds (node, successor iterator))
+            work: List[Tuple[int, Iterator[int]]] = [(root, iter(succ[root]))]
+            while work:
+                u, it = work[-1]
+                for v in it:
+                    if index[v] < 0:
+                        # 未访问后继：分配序号后深入 (Unvisited successor: number it and descend)
+                        index[v] = low[v] = counter
+                        counter += 1
+                        scc_stack.append(v)
+                        on_stack[v] = 1
+                        work.append((v, iter(succ[v])))
+                        break
+                    if on_stack[v] and index[v] < low[u]:
+                        low[u] = index[v]
+                else:
+                    # 后继遍历完毕：回传 low 值，并在根节点处弹出分量
+                    # (All successors visited: propagate low-link and pop the component at its root)
+                    work.pop()
+                    if work:
+                        parent: int = work[-1][0]
+                        if low[u] < low[parent]:
+                            low[parent] = low[u]
+                    if low[u] == index[u]:
+                        scc: List[int] = []
+                        while True:
+                            w: int = scc_stack.pop()
+                            on_stack[w] = 0
+                            scc.append(w)
+                            if w == u:
+                                break
+                        if len(scc) > 1 or u in succ[u]:
+                            sccs.append(scc)
+
         cycles: List[List[str]] = []
+        for scc in sccs:
+            # 从名称最小（即编号最小）的成员出发 (Start from the smallest-named, i.e. smallest-id, member)
+            start: int = min(scc)
+            if start in succ[start]:
+                # 自环 (Self-loop)
+                cycles.append([names[start], names[start]])
+                continue
+            # 分量内 BFS，后继按名称排序以保证结果稳定 (BFS inside the component; successors sorted by name for a stable result)
+            members: Set[int] = set(scc)
+            prev: Dict[int, int] = {start: -1}
+            queue: deque = deque([start])
+            last: int = -1
+            while queue and last < 0:
+                u = queue.popleft()
+                for v in sorted(succ[u]):
+                    if v == start:
+                        last = u
+                        break
+                    if v in members and v not in prev:
+                        prev[v] = u
+                        queue.append(v)
+            # 沿 prev 回溯出 start -> ... -> last，再闭合回 start (Backtrack start -> ... -> last via prev, then close back to start)
+            path: List[int] = []
+            while last >= 0:
+                path.append(last)
+                last = prev[last]
+            path.reverse()
+            path.append(start)
+            cycles.append([names[i] for i in path])
+        cycles.sort()
 
-        def dfs(u: str) -> None:
-            color[u] = GRAY
-            for v in self.nodes[u].imports_internal:
-                if v not in self.nodes:
-                    continue
-                if color[v] == WHITE:
-                    parent[v] = u
-                    dfs(v)
-                elif color[v] == GRAY:
-                    # 找到回边，构造循环 (Found back edge, build cycle)
-                    cycle: List[str] = [v]
-                    cur: Optional[str] = u
-                    while cur != v and cur in parent:
-                        cycle.append(cur)
-                        cur = parent[cur]
-                    cycle.append(v)
-                    cycle.reverse()
-                    # 去重 (Deduplication)
-                    key: str = "->".join(cycle)
-                    if key not in seen_cycles:
-                        seen_cycles.add(key)
-                        cycles.append(cycle)
-            color[u] = BLACK
-
-        seen_cycles: Set[str] = set()
-        for node in self.nodes:
-            if color[node] == WHITE:
-                parent[node] = None
-                dfs(node)
         if self.verbose:
             print(f"[cycles] found {len(cycles)} cycles")
         return cycles
@@ -892,50 +1586,55 @@ class DependencyAnalyzer:
         """
         if self.verbose:
             print(f"[export] writing markdown to {self.out_md}")
-        lines: List[str] = []
-        lines.append("# Python 文件依赖分析报告\n")
-        lines.append(f"- 根目录：`{self.root}`  \n")
-        lines.append(f"- 文件数量：**{len(self.nodes)}**  \n")
+        # 报告先在内存中拼成一个字符串，再以大缓冲区一次写出 (Build the report in memory and write it once through a large buffer)
+        buf: List[str] = []
+        add = buf.append
+        add("# Python 文件依赖分析报告\n")
+        add(f"- 根目录：`{self.root}`  \n")
+        add(f"- 文件数量：**{len(self.nodes)}**  \n")
         if cycles:
-            lines.append(f"- 检测到循环依赖：**{len(cycles)}** 个（见下方）  \n")
+            add(f"- 检测到循环依赖：**{len(cycles)}** 个（见下方）  \n")
         else:
-            lines.append(f"- 检测到循环依赖：**0**  \n")
+            add(f"- 检测到循环依赖：**0**  \n")
         # 新增：标注强制依赖逻辑说明 (New: Add forced dependency logic description)
-        lines.append(
+        add(
             f"- 强制依赖：若 `drivers/__init__.py`、`libs/__init__.py`、`tasks/__init__.py` 存在，则自动设为 `main.py` 的依赖  \n"
         )
-        lines.append("\n---\n")
-        lines.append("## 模块依赖表\n")
-        lines.append(
+        add("\n---\n")
+        add("## 模块依赖表\n")
+        add(
             "（`module_id` 使用相对路径作为唯一标识；`dotted_name` 如果为包路径则为点分名）\n"
         )
-        lines.append(
+        add(
             "\n| Module (module_id) | Dotted name | Size (bytes) | Imports (internal) | Imports (external) | Imported-by |\n"
         )
-        lines.append("|---|---:|---:|---|---|---|\n")
-        for module_id in sorted(self.nodes):
-            row: str = self.nodes[module_id].to_md_row()
-            lines.append(row + "\n")
+        add("|---|---:|---:|---|---|---|\n")
+        nodes: Dict[str, FileNode] = self.nodes
+        buf.extend([nodes[m].to_md_row() + "\n" for m in self._ensure_sorted_ids()])
         # 循环依赖详情 (Cyclic dependency details)
         if cycles:
-            lines.append("\n---\n")
-            lines.append("## 循环依赖详情\n")
+            add("\n---\n")
+            add("## 循环依赖详情\n")
             for i, cyc in enumerate(cycles, 1):
-                lines.append(f"- Cycle {i}: `{' -> '.join(cyc)}`  \n")
+                add(f"- Cycle {i}: `{' -> '.join(cyc)}`  \n")
         # 被引用次数排行 (Referenced times ranking)
-        lines.append("\n---\n")
-        lines.append("## 被引用次数排行（Top 20）\n")
-        counts: List[Tuple[str, int]] = sorted(
+        add("\n---\n")
+        add("## 被引用次数排行（Top 20）\n")
+        # 只需前20名，使用有界堆避免全量排序 (Only the top 20 are needed, use a bounded heap instead of a full sort)
+        counts: List[Tuple[str, int]] = heapq.nlargest(
+            20,
             ((m, len(n.imported_by)) for m, n in self.nodes.items()),
-            key=lambda x: -x[1],
+            key=operator.itemgetter(1),
         )
-        lines.append("| Module | Imported-by count |\n")
-        lines.append("|---|---:|\n")
-        for m, c in counts[:20]:
-            lines.append(f"| `{m}` | {c} |\n")
-        # 写文件 (Write to file)
-        with open(self.out_md, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+        add("| Module | Imported-by count |\n")
+        add("|---|---:|\n")
+        for m, c in counts:
+            add(f"| `{m}` | {c} |\n")
+        text: str = "".join(buf)
+        with open(self.out_md, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(text)
+        # 保留内存中的报告行，可视化无需再从磁盘读回 (Keep the report lines in memory so visualization need not read them back from disk)
+        self.md_lines = text.splitlines(True)
         if self.verbose:
             print("[export] done.")
 
@@ -947,11 +1646,18 @@ class DependencyAnalyzer:
         执行顺序：
         1. scan_files：扫描Python文件，构建module_map；
         2. build_module_map：创建FileNode实例，构建nodes和dotted_map；
-        3. parse_all_files：解析AST，提取依赖关系；
-        4. _add_main_forced_deps：添加强制依赖（main.py→特定__init__.py）；
-        5. link_reverse：构建反向依赖关系；
-        6. find_cycles：检测循环依赖；
-        7. export_markdown：生成Markdown分析报告。
+        3. parse_all_files：解析AST，提取依赖关系，同时建立反向依赖关系；
+        4. _add_main_forced_deps：添加强制依赖（main.py→特定__init__.py），同步更新反向依赖；
+        5. find_cycles：检测循环依赖；
+        6. export_markdown：生成Markdown分析报告。
+
+        设置cache_path时，若构建模块集合后计算的输入签名与报告旁.sig文件中记录的一致且报告存在，
+        则跳过后续步骤直接返回；报告生成后写回新的签名。未设置cache_path时不记录签名，并删除报告旁残留的.sig文件，
+        以免之后带缓存的运行误用与当前报告不符的旧签名。
+
+        注意：跳过时只执行了步骤1、2，nodes中各节点的imports_internal、imports_external、imported_by均为空，
+        md_lines保持为None；需要依赖关系的调用方应在run()之后自行调用parse_all_files、_add_main_forced_deps，
+        或直接读取已有报告。
 
         日志输出：在verbose模式下打印各步骤进度。
 
@@ -965,11 +1671,19 @@ class DependencyAnalyzer:
         Execution order:
         1. scan_files: Scan Python files and build module_map;
         2. build_module_map: Create FileNode instances, build nodes and dotted_map;
-        3. parse_all_files: Parse AST and extract dependencies;
-        4. _add_main_forced_deps: Add forced dependencies (main.py→specific __init__.py);
-        5. link_reverse: Build reverse dependency relationships;
-        6. find_cycles: Detect cyclic dependencies;
-        7. export_markdown: Generate Markdown analysis report.
+        3. parse_all_files: Parse AST and extract dependencies, building reverse dependency relationships at the same time;
+        4. _add_main_forced_deps: Add forced dependencies (main.py→specific __init__.py), updating reverse dependencies as well;
+        5. find_cycles: Detect cyclic dependencies;
+        6. export_markdown: Generate Markdown analysis report.
+
+        When cache_path is set and the input signature computed after building the module set matches the one recorded in the .sig file
+        next to the report, and the report exists, the remaining steps are skipped; the new signature is written back after the report
+        is generated. Without cache_path no signature is recorded, and any leftover .sig file next to the report is removed so that a
+        later cached run cannot trust an old signature that no longer matches the current report.
+
+        Note: on a skip only steps 1 and 2 have run, so imports_internal, imports_external and imported_by of every node are empty and
+        md_lines stays None; callers that need the dependencies should call parse_all_files and _add_main_forced_deps themselves after
+        run(), or read the existing report.
 
         Log output: Print progress of each step in verbose mode.
 
@@ -978,12 +1692,34 @@ class DependencyAnalyzer:
         """
         self.scan_files()
         self.build_module_map()
+        run_sig: Optional[str] = None
+        if self.cache_path:
+            # 输入文件集合与上次完全一致且报告仍在时，直接复用上次的报告
+            # (Reuse the previous report when the input files are exactly the same as last time and the report still exists)
+            run_sig = self._run_signature()
+            try:
+                with open(f"{self.out_md}.sig", "r", encoding="utf-8") as f:
+                    unchanged: bool = f.read() == run_sig and os.path.exists(self.out_md)
+            except OSError:
+                unchanged = False
+            if unchanged:
+                if self.verbose:
+                    print(f"[cache] nothing changed, keeping {self.out_md}")
+                return
         self.parse_all_files()
-        # 新增：在解析完原有依赖后、构建反向依赖前添加强制依赖 (New: Add forced dependencies after parsing original dependencies and before building reverse dependencies)
+        # 在解析完原有依赖后添加强制依赖，反向依赖已在解析时建立并随之更新
+        # (Add forced dependencies after parsing; reverse links were built during parsing and are updated along with them)
         self._add_main_forced_deps()
-        self.link_reverse()
         cycles: List[List[str]] = self.find_cycles()
         self.export_markdown(cycles)
+        if run_sig is not None:
+            self._save_run_signature(run_sig)
+        else:
+            # 未记录签名时删除旧签名，避免其与新报告不符 (Drop the old signature when none is recorded, so it cannot mismatch the new report)
+            try:
+                os.remove(f"{self.out_md}.sig")
+            except OSError:
+                pass
 
 class MarkdownVisualizer:
     """
@@ -1001,7 +1737,6 @@ class MarkdownVisualizer:
 
     新增功能：
       - 模块分组视觉标识：通过颜色区分引导核心、板级配置、任务层、驱动层、公共库。
-      - 多箭头防重叠：同一对节点间的多个依赖箭头自动分散排列。
       - 循环依赖标记：循环依赖中的节点采用红色背景高亮显示。
 
     Attributes:
@@ -1011,30 +1746,50 @@ class MarkdownVisualizer:
         NODE_H_SPACING (int): 同一层内节点的水平间距（像素），默认150。
         MARGIN (int): SVG 画布的边缘间距（像素），默认30。
         ARROW_OFFSET (int): 箭头端点与节点的距离（像素），默认0。
-        ARROW_SPACING (int): 多箭头间的分散间距（像素），默认20。
-        GROUP_CONFIG (Dict[str, Tuple[Callable[[str], bool], str, str]]): 模块分组配置，键为分组名，值为(匹配函数, 边框色, 背景色)。
-        edge_counter (Dict[Tuple[str, str], int]): 跟踪同一对节点间的箭头数量，用于解决重叠问题。
+        ARROW_SPACING (int): 多箭头间的分散间距（像素），默认20；邻接表为集合，同一对节点间至多一条边，当前未使用。
+        _ELLIPSIS_RE (re.Pattern): 预编译的末尾省略号匹配正则，用于清理单元格内容。
+        _TABLE_SEP_RE (re.Pattern): 预编译的表格分隔线匹配正则，用于定位表格起始位置。
+        _SEP_ROW_PREFIXES (Tuple[str, ...]): 表格分隔线行的起始前缀，用于在正则匹配前跳过分隔线行。
+        _ROW_RE (re.Pattern): 预编译的表格数据行匹配正则，一次匹配取出所需的各列。
+        _CELL_TOKEN_RE (re.Pattern): 预编译的单元格条目匹配正则，用于一次扫描拆分依赖列表。
+        _ESCAPE_TABLE (Dict[int, str]): HTML 转义用的 str.translate 转换表。
+        _SVG_DEFS (bytes): 固定的 SVG 箭头标记定义片段（已编码）。
+        _SVG_OPEN_FMT (bytes): SVG 开始标签的 % 格式模板（宽、高、viewBox 宽高），字节串。
+        _HTML_STYLE (str): 固定的页面 <style> 样式块。
+        _GROUP_LEGEND_HTML (str): 固定的模块分组图例 HTML 片段。
+        _EMPTY_HTML_FMT (str): 报告中没有任何模块时输出的最简 HTML 页面模板（参数为转义后的标题）。
+        GROUP_CONFIG (Dict[str, Tuple[Union[str, Callable[[str], bool]], str, str]]): 模块分组配置，键为分组名，
+            值为(匹配正则或匹配函数, 边框色, 背景色)；兼容旧版以匹配函数（如 lambda）配置的写法。
         md_path (str): 输入 Markdown 依赖报告的文件路径。
+        _preparsed_lines (Optional[List[str]]): 调用方已持有的报告行；提供时 _read_md 直接返回而不读取文件。
         nodes (Dict[str, Dict]): 模块信息字典，键为 module_id，值包含dotted、imports、external、imported_by字段。
         adj (Dict[str, Set[str]]): 邻接表，存储依赖关系（被依赖者 → 依赖者）。
-        cycles (List[List[str]]): 循环依赖路径列表，每个子列表为一个循环。
+        _sorted_adj (Dict[str, List[str]]): 与 adj 相同但目标已排序的邻接表，解析表格时构建一次。
+        _names (List[str]): 按名称排序的模块ID，下标即整数编号，解析表格时构建一次。
+        _succ (List[List[int]]): 以整数编号表示的邻接表（目标升序），供循环检测与分层共用。
+        cycles (List[List[str]]): 循环依赖分组列表，每个子列表为一个强连通分量中（已排序）的模块ID。
+        cycle_nodes (Set[str]): 处于循环依赖中的全部模块ID，由 _detect_cycles 一并生成。
         _canvas_w (int): SVG 画布宽度（像素），默认800。
         _canvas_h (int): SVG 画布高度（像素），默认600。
+        _group_re (Optional[re.Pattern]): 由 GROUP_CONFIG 全部正则合并成的单个正则，每个分组对应一个命名组；配置中含匹配函数时为None。
+        _group_styles (Dict[str, Tuple[str, str]]): 命名组名称到(边框色, 背景色)的映射。
+        _group_matchers (List[Tuple[Callable[[str], object], Tuple[str, str]]]): 配置中含匹配函数时按顺序逐个尝试的(匹配函数, 样式)列表。
 
     Methods:
-        __init__(md_path: str) -> None: 初始化可视化生成器实例。
+        __init__(md_path: str, preparsed_lines: Optional[List[str]] = None) -> None: 初始化可视化生成器实例。
         _read_md() -> List[str]: 读取 Markdown 文件内容，返回行列表。
         _clean_item(s: str) -> str: 清理模块标识字符串，移除反引号和省略后缀。
         _split_cell(cell: str) -> List[str]: 拆分表格单元格内容，提取依赖模块列表。
         _parse_md_table(lines: List[str]) -> None: 解析 Markdown 表格，提取模块信息和依赖关系。
         _compute_layers() -> Dict[int, List[str]]: 基于拓扑排序计算模块的分层布局。
-        _layout_positions(layers: Dict[int, List[str]]) -> Dict[str, Tuple[float, float]]: 计算每个模块节点的坐标位置。
+        _layout_positions(layers: Dict[int, List[str]]) -> Tuple[List[str], array, array]: 计算每个模块节点的坐标位置（并行数组）。
         _escape(s: str) -> str: 对字符串进行 HTML 转义，避免注入问题。
-        _detect_cycles() -> None: 采用 DFS 三色标记法检测循环依赖。
+        _detect_cycles() -> None: 采用迭代式 Tarjan 强连通分量算法检测循环依赖。
         _get_group_style(module_id: str) -> Tuple[str, str]: 根据模块ID匹配分组样式，返回(边框色, 背景色)。
-        _render_svg(positions: Dict[str, Tuple[float, float]]) -> str: 生成 SVG 图形字符串，包含箭头和节点。
-        _assemble_html(svg: str, title: str) -> str: 组装完整的 HTML 文档，修复缩进格式。
-        generate_html(out_html: str) -> None: 一键生成可视化 HTML 文件，包含完整流程执行。
+        _render_svg(order: List[str], xs: array, ys: array, out: BinaryIO) -> None: 将 SVG 图形（箭头和节点）以 UTF-8 字节直接写入输出文件。
+        _assemble_html(title: str) -> Tuple[List[str], str]: 组装 SVG 前后的 HTML 文档片段，修复缩进格式。
+        _write_html(title: str, path: str) -> None: 执行循环检测、布局与渲染，将完整 HTML 写入指定路径。
+        generate_html(out_html: str) -> None: 一键生成可视化 HTML 文件（临时文件加原子替换），包含完整流程执行。
 
     Notes:
         - 依赖关系箭头方向：从被依赖模块指向依赖它的模块（符合"上游支撑下游"直觉）。
@@ -1058,7 +1813,6 @@ class MarkdownVisualizer:
 
     New Features:
       - Module grouping visual identification: Distinguishes boot core, board config, task layer, driver layer, and common library by color.
-      - Multi-arrow anti-overlap: Multiple dependency arrows between the same pair of nodes are automatically spaced out.
       - Cyclic dependency marking: Nodes in cyclic dependencies are highlighted with red backgrounds.
 
     Attributes:
@@ -1068,30 +1822,50 @@ class MarkdownVisualizer:
         NODE_H_SPACING (int): Horizontal spacing between nodes in the same layer (pixels), default 150.
         MARGIN (int): Edge margin of SVG canvas (pixels), default 30.
         ARROW_OFFSET (int): Distance between arrow endpoint and node (pixels), default 0.
-        ARROW_SPACING (int): Spacing between multiple arrows (pixels), default 20.
-        GROUP_CONFIG (Dict[str, Tuple[Callable[[str], bool], str, str]]): Module grouping configuration, key is group name, value is (matching function, border color, background color).
-        edge_counter (Dict[Tuple[str, str], int]): Tracks the number of arrows between the same pair of nodes to solve overlap issues.
+        ARROW_SPACING (int): Spacing between multiple arrows (pixels), default 20; unused since the set-valued adjacency allows at most one edge per node pair.
+        _ELLIPSIS_RE (re.Pattern): Precompiled regex matching a trailing ellipsis, used to clean cell content.
+        _TABLE_SEP_RE (re.Pattern): Precompiled regex matching the table separator line, used to locate the table start.
+        _SEP_ROW_PREFIXES (Tuple[str, ...]): Leading prefixes of table separator rows, used to skip them before the regex match.
+        _ROW_RE (re.Pattern): Precompiled regex matching a table data row, capturing the needed columns in one match.
+        _CELL_TOKEN_RE (re.Pattern): Precompiled regex matching a single cell entry, used to split dependency lists in one scan.
+        _ESCAPE_TABLE (Dict[int, str]): str.translate table used for HTML escaping.
+        _SVG_DEFS (bytes): Fixed SVG arrow marker definition fragment, pre-encoded.
+        _SVG_OPEN_FMT (bytes): % format template (bytes) for the opening SVG tag (width, height, viewBox width/height).
+        _HTML_STYLE (str): Fixed page <style> block.
+        _GROUP_LEGEND_HTML (str): Fixed module group legend HTML fragment.
+        _EMPTY_HTML_FMT (str): Minimal HTML page template written when the report has no modules (argument: the escaped title).
+        GROUP_CONFIG (Dict[str, Tuple[Union[str, Callable[[str], bool]], str, str]]): Module grouping configuration, key is group name,
+            value is (match regex or matching function, border color, background color); the older form with matching functions (e.g. lambdas) is still accepted.
         md_path (str): File path of input Markdown dependency report.
+        _preparsed_lines (Optional[List[str]]): Report lines already held by the caller; when given, _read_md returns them instead of reading the file.
         nodes (Dict[str, Dict]): Module information dictionary, key is module_id, value contains dotted, imports, external, imported_by fields.
         adj (Dict[str, Set[str]]): Adjacency list storing dependencies (dependent module → dependent module).
-        cycles (List[List[str]]): List of cyclic dependency paths, each sublist is a cycle.
+        _sorted_adj (Dict[str, List[str]]): Same as adj but with sorted targets, built once when parsing the table.
+        _names (List[str]): Module IDs sorted by name; the index is the integer id. Built once when parsing the table.
+        _succ (List[List[int]]): Adjacency list over integer ids (targets ascending), shared by cycle detection and layering.
+        cycles (List[List[str]]): List of cyclic dependency groups, each sublist holds the (sorted) module IDs of one strongly connected component.
+        cycle_nodes (Set[str]): All module IDs involved in cyclic dependencies, produced alongside cycles by _detect_cycles.
         _canvas_w (int): SVG canvas width in pixels, default 800.
         _canvas_h (int): SVG canvas height in pixels, default 600.
+        _group_re (Optional[re.Pattern]): Single regex merged from all GROUP_CONFIG regexes, with one named group per group; None when the config contains matching functions.
+        _group_styles (Dict[str, Tuple[str, str]]): Mapping from named group name to (border color, background color).
+        _group_matchers (List[Tuple[Callable[[str], object], Tuple[str, str]]]): (matcher, style) pairs tried in order when the config contains matching functions.
 
     Methods:
-        __init__(md_path: str) -> None: Initialize the visualizer instance.
+        __init__(md_path: str, preparsed_lines: Optional[List[str]] = None) -> None: Initialize the visualizer instance.
         _read_md() -> List[str]: Read Markdown file content and return line list.
         _clean_item(s: str) -> str: Clean module identifier string, remove backticks and ellipsis suffix.
         _split_cell(cell: str) -> List[str]: Split table cell content and extract dependency module list.
         _parse_md_table(lines: List[str]) -> None: Parse Markdown table and extract module information and dependencies.
         _compute_layers() -> Dict[int, List[str]]: Calculate layered layout of modules based on topological sorting.
-        _layout_positions(layers: Dict[int, List[str]]) -> Dict[str, Tuple[float, float]]: Calculate coordinate positions of each module node.
+        _layout_positions(layers: Dict[int, List[str]]) -> Tuple[List[str], array, array]: Calculate coordinate positions of each module node (parallel arrays).
         _escape(s: str) -> str: HTML-escape strings to avoid injection issues.
-        _detect_cycles() -> None: Detect cyclic dependencies using DFS three-color marking method.
+        _detect_cycles() -> None: Detect cyclic dependencies using an iterative Tarjan strongly connected component algorithm.
         _get_group_style(module_id: str) -> Tuple[str, str]: Match group style by module ID, return (border color, background color).
-        _render_svg(positions: Dict[str, Tuple[float, float]]) -> str: Generate SVG graphic string containing arrows and nodes.
-        _assemble_html(svg: str, title: str) -> str: Assemble complete HTML document with fixed indentation.
-        generate_html(out_html: str) -> None: One-click generate visual HTML file, including complete process execution.
+        _render_svg(order: List[str], xs: array, ys: array, out: BinaryIO) -> None: Write the SVG graphic (arrows and nodes) as UTF-8 bytes directly to the output file.
+        _assemble_html(title: str) -> Tuple[List[str], str]: Assemble the HTML document chunks around the SVG with fixed indentation.
+        _write_html(title: str, path: str) -> None: Run cycle detection, layout and rendering and write the complete HTML to the given path.
+        generate_html(out_html: str) -> None: One-click generate visual HTML file (temporary file plus atomic replace), including complete process execution.
 
     Notes:
         - Dependency arrow direction: From dependent module to the module that depends on it (conforming to "upstream supports downstream" intuition).
@@ -1109,43 +1883,113 @@ class MarkdownVisualizer:
 
     # 箭头参数配置 (Arrow parameter configuration)
     ARROW_OFFSET: int = 0  # 增大箭头与节点的距离 (Distance between arrow and node)
-    ARROW_SPACING: int = 20  # 多个箭头之间的间距 (Spacing between multiple arrows)
-
-    # 模块分组配置（分组名 → (匹配函数, 边框色, 背景色)）
-    # Module grouping config (group name → (matching func, border color, background color))
-    GROUP_CONFIG: Dict[str, Tuple[Callable[[str], bool], str, str]] = {
+    ARROW_SPACING: int = 20  # 多个箭头之间的间距，当前未使用 (Spacing between multiple arrows, currently unused)
+
+    # 预编译的正则表达式 (Precompiled regular expressions)
+    _ELLIPSIS_RE: re.Pattern = re.compile(r",\s*\.\.\..*$")  # 末尾省略号 (Trailing ellipsis)
+    _TABLE_SEP_RE: re.Pattern = re.compile(r"\|\s*-{3,}")  # 表格分隔线 (Table separator line)
+    # 表格分隔线行的起始前缀（如 "|---"、"| ---"、"|:--"）(Leading prefixes of table separator rows, e.g. "|---", "| ---", "|:--")
+    _SEP_ROW_PREFIXES: Tuple[str, ...] = ("|-", "| -", "|:", "| :")
+    # 表格数据行：一次匹配取出模块、点分名、内部依赖、外部依赖、被引用者五列（跳过大小列）
+    # (Table data row: capture module, dotted name, internal imports, external imports and imported-by in one match, skipping the size column)
+    _ROW_RE: re.Pattern = re.compile(r"\s*\|([^|]*)\|([^|]*)\|[^|]*\|([^|]*)\|([^|]*)\|([^|]*)\|")
+    # HTML 转义表，与 html.escape(quote=True) 的输出一致 (HTML escape table, matching html.escape(quote=True) output)
+    _ESCAPE_TABLE: Dict[int, str] = str.maketrans(
+        {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+    )
+    # 单元格中的单个条目（不含两端空白，反引号需事先移除）(A single cell entry without surrounding whitespace; backticks are removed beforehand)
+    _CELL_TOKEN_RE: re.Pattern = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+    # SVG 箭头标记定义（固定内容，纯 ASCII 字节串）(SVG arrow marker definition: fixed content, ASCII bytes)
+    _SVG_DEFS: bytes = b"""<defs>
+            <marker id="arrow" markerWidth="18" markerHeight="18" refX="16" refY="9" orient="auto">
+                <path d="M0,0 L18,9 L0,18 z" fill="#555" />
+            </marker>
+        </defs>"""
+    # SVG 开始标签模板：宽、高与 viewBox 宽高 (Opening SVG tag template: width, height and viewBox width/height)
+    _SVG_OPEN_FMT: bytes = (
+        b'<svg width="%d" height="%d" viewBox="0 0 %d %d" xmlns="http://www.w3.org/2000/svg" role="img">'
+    )
+    # 页面样式块（固定内容）(Page style block: fixed content)
+    _HTML_STYLE: str = """<style>
+                body { 
+                    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial; 
+                    padding: 16px; 
+                }
+                .svg-wrap { 
+                    border: 1px solid #ddd; 
+                    overflow: auto; 
+                    padding: 16px; 
+                    background: #fafafa; 
+                }
+                .legend { 
+                    margin-top: 12px; 
+                    font-size: 14px; 
+                    color: #444; 
+                }
+                .group-legend { 
+                    font-size: 14px; 
+                    color: #444; 
+                }
+            </style>"""
+    # 分组图例（固定内容）(Group legend: fixed content)
+    _GROUP_LEGEND_HTML: str = """
+        <div class="group-legend" style="margin: 12px 0; padding: 8px; background: #f0f0f0; border-radius: 4px;">
+            <p style="margin: 0 0 8px 0; font-weight: bold;">模块分组说明：</p>
+            <ul style="margin: 0; padding-left: 20px; line-height: 1.6;">
+                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #2563eb; background: #eff6ff;"></span>引导核心：boot、main.py</li>
+                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #7c3aed; background: #f5f3ff;"></span>板级配置：board、conf</li>
+                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #16a34a; background: #ecfdf5;"></span>任务层：tasks/ 下所有任务文件</li>
+                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #ea580c; background: #fff7ed;"></span>驱动层：drivers/ 下所有驱动包</li>
+                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #0891b2; background: #ecfeff;"></span>公共库：libs/ 下所有工具库（logger/network 等）</li>
+            </ul>
+        </div>"""
+    # 报告中没有任何模块时的最简页面 (Minimal page used when the report contains no modules)
+    _EMPTY_HTML_FMT: str = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <title>%s</title>
+</head>
+<body>
+    <h2>%s</h2>
+    <p>未发现任何模块依赖 (No dependencies.)</p>
+</body>
+</html>
+"""
+
+    # 模块分组配置（分组名 → (匹配正则, 边框色, 背景色)），正则从 module_id 开头匹配；
+    # 子类也可沿用旧写法，以接收 module_id 并返回布尔值的匹配函数代替正则
+    # Module grouping config (group name → (match regex, border color, background color)), regexes match from the start of module_id;
+    # subclasses may still use the older form, giving a function that takes module_id and returns a bool instead of a regex
+    GROUP_CONFIG: Dict[str, Tuple[Union[str, Callable[[str], bool]], str, str]] = {
         "引导核心": (
-            lambda mid: mid in ("boot", "main"),  # 精确匹配核心入口文件 (Exact match for core entry files)
+            r"(?:boot|main)\Z",  # 精确匹配核心入口文件 (Exact match for core entry files)
             "#2563eb",  # 蓝色边框 (Blue border)
             "#eff6ff",  # 浅蓝色背景 (Light blue background)
         ),
         "板级配置": (
-            lambda mid: mid in ("board", "conf"),  # 精确匹配配置文件 (Exact match for config files)
+            r"(?:board|conf)\Z",  # 精确匹配配置文件 (Exact match for config files)
             "#7c3aed",  # 紫色边框 (Purple border)
             "#f5f3ff",  # 浅紫色背景 (Light purple background)
         ),
         "任务层": (
-            lambda mid: mid.startswith("tasks/"),  # 匹配 tasks/ 目录下的文件 (Match files under tasks/)
+            r"tasks/",  # 匹配 tasks/ 目录下的文件 (Match files under tasks/)
             "#16a34a",  # 绿色边框 (Green border)
             "#ecfdf5",  # 浅绿色背景 (Light green background)
         ),
         "驱动层": (
-            lambda mid: mid.startswith("drivers/"),  # 匹配 drivers/ 目录下的文件 (Match files under drivers/)
+            r"drivers/",  # 匹配 drivers/ 目录下的文件 (Match files under drivers/)
             "#ea580c",  # 橙色边框 (Orange border)
             "#fff7ed",  # 浅橙色背景 (Light orange background)
         ),
         "公共库": (
-            lambda mid: mid.startswith("libs/"),  # 匹配 libs/ 目录下的文件 (Match files under libs/)
+            r"libs/",  # 匹配 libs/ 目录下的文件 (Match files under libs/)
             "#0891b2",  # 青色边框 (Cyan border)
             "#ecfeff",  # 浅青色背景 (Light cyan background)
         ),
     }
 
-    # 用于跟踪同一对节点间的箭头数量，解决重叠问题
-    # Track arrow count between the same node pair to avoid overlap
-    edge_counter: Dict[Tuple[str, str], int] = {}
-
-    def __init__(self, md_path: str) -> None:
+    def __init__(self, md_path: str, preparsed_lines: Optional[List[str]] = None) -> None:
         """
         初始化 Markdown 依赖可视化生成器实例。
 
@@ -1154,6 +1998,8 @@ class MarkdownVisualizer:
 
         Args:
             md_path (str): 输入 Markdown 依赖分析报告的文件路径（支持相对路径或绝对路径）。
+            preparsed_lines (Optional[List[str]], optional): 报告内容的行列表（如 DependencyAnalyzer.md_lines），
+                提供时不再从 md_path 读取，默认值为None。
 
         ==========================================
 
@@ -1164,17 +2010,46 @@ class MarkdownVisualizer:
 
         Args:
             md_path (str): File path of input Markdown dependency analysis report (supports relative or absolute path).
+            preparsed_lines (Optional[List[str]], optional): Lines of the report content (e.g. DependencyAnalyzer.md_lines);
+                when given, md_path is not read. Default is None.
         """
         self.md_path: str = md_path
+        # 调用方提供的报告行 (Report lines supplied by the caller)
+        self._preparsed_lines: Optional[List[str]] = preparsed_lines
         # module_id → { dotted, imports(set), external(set), imported_by(set) }
         self.nodes: Dict[str, Dict] = {}
         # 邻接表：被依赖者 → 依赖者 (Adjacency list: dependent module → module that depends on it)
         self.adj: Dict[str, Set[str]] = {}
-        # 循环依赖路径列表 (List of cyclic dependency paths)
+        # 排序后的邻接表，保证箭头绘制顺序稳定 (Sorted adjacency list for a stable arrow drawing order)
+        self._sorted_adj: Dict[str, List[str]] = {}
+        # 整数编号到模块ID的映射及整数邻接表 (Integer id to module ID mapping and the integer adjacency list)
+        self._names: List[str] = []
+        self._succ: List[List[int]] = []
+        # 循环依赖分组列表（强连通分量）(List of cyclic dependency groups: strongly connected components)
         self.cycles: List[List[str]] = []
+        # 处于循环依赖中的全部节点 (All nodes involved in cyclic dependencies)
+        self.cycle_nodes: Set[str] = set()
         # 画布初始尺寸 (Initial canvas size)
         self._canvas_w: int = 800
         self._canvas_h: int = 600
+        # 将分组正则按配置顺序合并为一个带命名组的正则，一次匹配即可确定分组（先出现的分组优先）
+        # (Merge group regexes in config order into one regex with named groups; one match decides the group, earlier groups win)
+        self._group_styles: Dict[str, Tuple[str, str]] = {}
+        self._group_matchers: List[Tuple[Callable[[str], object], Tuple[str, str]]] = []
+        self._group_re: Optional[re.Pattern] = None
+        entries: List[Tuple[Union[str, Callable[[str], bool]], str, str]] = list(self.GROUP_CONFIG.values())
+        if all(isinstance(pattern, str) for pattern, _, _ in entries):
+            alternatives: List[str] = []
+            for i, (pattern, border_color, bg_color) in enumerate(entries):
+                alternatives.append(f"(?P<g{i}>{pattern})")
+                self._group_styles[f"g{i}"] = (border_color, bg_color)
+            self._group_re = re.compile("|".join(alternatives))
+        else:
+            # 配置中含匹配函数（旧写法）时按顺序逐个尝试，正则条目编译后同样参与
+            # (With matching functions in the config (older form) try each entry in order; regex entries are compiled and take part too)
+            for pattern, border_color, bg_color in entries:
+                matcher: Callable[[str], object] = re.compile(pattern).match if isinstance(pattern, str) else pattern
+                self._group_matchers.append((matcher, (border_color, bg_color)))
 
     # ---------------- MD 解析部分 (MD Parsing Section) ----------------
     def _read_md(self) -> List[str]:
@@ -1182,6 +2057,7 @@ class MarkdownVisualizer:
         读取 Markdown 文件内容，返回按行分割的字符串列表。
 
         采用 UTF-8 编码读取文件，确保中文等特殊字符正确解析，每行末尾的换行符已去除。
+        初始化时提供了 preparsed_lines 则直接返回，不访问磁盘。
 
         Returns:
             List[str]: Markdown 文件内容的行列表，每个元素对应一行内容。
@@ -1192,10 +2068,13 @@ class MarkdownVisualizer:
 
         Read file with UTF-8 encoding to ensure correct parsing of special characters like Chinese,
         newline characters at the end of each line are removed.
+        If preparsed_lines was given at initialization it is returned directly without touching the disk.
 
         Returns:
             List[str]: Line list of Markdown file content, each element corresponds to one line.
         """
+        if self._preparsed_lines is not None:
+            return self._preparsed_lines
         with open(self.md_path, "r", encoding="utf-8") as f:
             return f.readlines()
 
@@ -1232,7 +2111,7 @@ class MarkdownVisualizer:
         s = s.strip()
         if s.startswith("`") and s.endswith("`"):
             s = s[1:-1].strip()
-        s = re.sub(r",\s*\.\.\..*$", "", s)
+        s = self._ELLIPSIS_RE.sub("", s)
         return s
 
     def _split_cell(self, cell: str) -> List[str]:
@@ -1242,7 +2121,9 @@ class MarkdownVisualizer:
         处理逻辑：
         1. 去除单元格前后空白，空内容或 "-" 直接返回空列表；
         2. 移除所有反引号和末尾省略号；
-        3. 按逗号分割字符串，过滤空字符串后返回模块列表。
+        3. 通过一次预编译正则扫描提取逗号分隔的非空条目（去除两端空白），返回模块列表。
+
+        反引号在拆分前整体移除，因此 "`a`b" 得到 ['ab']，单独的 "..." 条目原样保留，与按逗号分割后逐项 strip 的结果一致。
 
         Args:
             cell (str): Markdown 表格单元格的原始内容（如 "`drivers/__init__`, `libs/__init__`"）。
@@ -1256,8 +2137,11 @@ class MarkdownVisualizer:
 
         Processing logic:
         1. Remove leading and trailing whitespace from cell, return empty list for empty content or "-";
-        2. Remove all backticks and trailing ellipsis;
-        3. Split string by commas, filter empty strings and return module list.
+        2. Remove all backticks and the trailing ellipsis;
+        3. Extract the non-empty comma-separated entries (without surrounding whitespace) with a single precompiled regex scan and return the module list.
+
+        Backticks are removed as a whole before splitting, so "`a`b" yields ['ab'] and a lone "..." entry is kept, matching the result of
+        splitting on commas and stripping each part.
 
         Args:
             cell (str): Raw content of Markdown table cell (e.g., "`drivers/__init__`, `libs/__init__`").
@@ -1268,10 +2152,9 @@ class MarkdownVisualizer:
         cell = cell.strip()
         if cell in ("", "-"):
             return []
-        cell = cell.replace("`", "")
-        cell = re.sub(r",\s*\.\.\..*$", "", cell)
-        parts = [p.strip() for p in cell.split(",") if p.strip()]
-        return parts
+        cell = self._ELLIPSIS_RE.sub("", cell.replace("`", ""))
+        # 一次正则扫描直接提取各条目 (Extract entries directly with a single regex scan)
+        return self._CELL_TOKEN_RE.findall(cell)
 
     def _parse_md_table(self, lines: List[str]) -> None:
         """
@@ -1306,60 +2189,63 @@ class MarkdownVisualizer:
             None
         """
         in_table: bool = False
-        for i, ln in enumerate(lines):
-            ln = ln.rstrip("\n")
+        row_match = self._ROW_RE.match
+        clean_item = self._clean_item
+        split_cell = self._split_cell
+        for ln in lines:
+            stripped: str = ln.lstrip()
             if not in_table:
                 # 检测表格开始（包含分隔线的行）(Detect table start: line with separator)
-                if ln.strip().startswith("|") and re.search(r"\|\s*-{3,}", ln):
+                if stripped.startswith("|") and self._TABLE_SEP_RE.search(ln):
                     in_table = True
                 continue
             # 检测表格结束（非 "|" 开头的行）(Detect table end: line not starting with "|")
-            if not ln.strip().startswith("|"):
+            if not stripped.startswith("|"):
                 break
-            # 拆分表格列（去除首尾的 "|"）(Split table columns: remove leading/trailing "|")
-            cols = ln.split("|")[1:-1]
-            cols = [c.strip() for c in cols]
-            # 确保表格列数足够（至少6列）(Ensure sufficient table columns: at least 6)
-            if len(cols) < 6:
+            # 分隔线行用一次前缀判断跳过，不进入正则 (Skip separator rows with a single prefix test instead of the regex)
+            if stripped.startswith(self._SEP_ROW_PREFIXES):
+                continue
+            # 一次正则匹配取出所需列，不足6列的行匹配失败 (Take the needed columns with one regex match; rows with fewer than 6 columns do not match)
+            m = row_match(stripped)
+            if m is None:
                 continue
-            # 提取各列数据 (Extract column data)
-            module_col: str = cols[0]
-            dotted_col: str = cols[1]
-            imports_internal_col: str = cols[3]
-            imports_external_col: str = cols[4]
-            imported_by_col: str = cols[5]
+            module_col, dotted_col, imports_internal_col, imports_external_col, imported_by_col = m.groups()
 
             # 清理并存储模块信息 (Clean and store module information)
-            module_id: str = self._clean_item(module_col)
-            dotted: str = self._clean_item(dotted_col)
-            imports_internal: List[str] = self._split_cell(imports_internal_col)
-            imports_external: List[str] = self._split_cell(imports_external_col)
-            imported_by: List[str] = self._split_cell(imported_by_col)
-
-            self.nodes[module_id] = {
-                "dotted": dotted,
-                "imports": set(imports_internal),
-                "external": set(imports_external),
-                "imported_by": set(imported_by),
+            self.nodes[clean_item(module_col)] = {
+                "dotted": clean_item(dotted_col),
+                "imports": set(split_cell(imports_internal_col)),
+                "external": set(split_cell(imports_external_col)),
+                "imported_by": set(split_cell(imported_by_col)),
             }
 
+        nodes: Dict[str, Dict] = self.nodes
+        node_ids = nodes.keys()
         # 初始化邻接表 (Initialize adjacency list)
-        for m in self.nodes:
-            self.adj[m] = set()
-
-        # 基于 imports 列构建依赖关系（u依赖tgt → tgt被u依赖）
-        # Build dependencies from imports column (u depends on tgt → tgt is depended by u)
-        for u, props in self.nodes.items():
+        adj: Dict[str, Set[str]] = {m: set() for m in nodes}
+        self.adj = adj
+
+        for u, props in nodes.items():
+            # 基于 imported_by 列补充依赖关系（u被importer依赖 → u→importer），以集合交集批量合并
+            # (Supplement dependencies from imported_by column (u is depended by importer → u→importer), merged in bulk via set intersection)
+            adj[u] |= props["imported_by"] & node_ids
+            # 基于 imports 列构建依赖关系（u依赖tgt → tgt被u依赖）
+            # (Build dependencies from imports column (u depends on tgt → tgt is depended by u))
             for tgt in props["imports"]:
-                if tgt in self.nodes:
-                    self.adj[tgt].add(u)
-
-        # 基于 imported_by 列补充依赖关系（u被importer依赖 → u→importer）
-        # Supplement dependencies from imported_by column (u is depended by importer → u→importer)
-        for u, props in self.nodes.items():
-            for importer in props["imported_by"]:
-                if importer in self.nodes:
-                    self.adj[u].add(importer)
+                tgt_adj: Optional[Set[str]] = adj.get(tgt)
+                if tgt_adj is not None:
+                    tgt_adj.add(u)
+
+        # 邻接表构建完成后不再变化，预先排序供渲染使用 (adj no longer changes once built; pre-sort it for rendering)
+        sorted_adj: Dict[str, List[str]] = {u: sorted(vs) for u, vs in adj.items()}
+        self._sorted_adj = sorted_adj
+        # 按名称排序后映射为稠密整数（整数顺序即名称顺序），整数邻接表只构建一次，供循环检测与分层共用
+        # (Map names to dense integers in sorted order, so integer order is name order; the integer adjacency list
+        # is built once and shared by cycle detection and layering)
+        names: List[str] = sorted(adj)
+        idx: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._names = names
+        self._succ = [[idx[v] for v in sorted_adj[name]] for name in names]
 
     # ---------------- 布局与 Cycle 检测部分 (Layout & Cycle Detection Section) ----------------
     def _compute_layers(self) -> Dict[int, List[str]]:
@@ -1367,9 +2253,9 @@ class MarkdownVisualizer:
         基于拓扑排序计算模块的分层布局，确定各模块所在的层级。
 
         实现逻辑：
-        1. 计算每个节点的入度（被依赖次数）；
-        2. 采用广度优先搜索（BFS），先将入度为0的节点放入第0层；
-        3. 逐层处理节点，将其依赖的节点入度减1，入度为0时放入下一层；
+        1. 按名称顺序将模块映射为整数，在整数邻接表上计算每个节点的入度（被依赖次数）；
+        2. 采用 Kahn 算法逐层推进，先将入度为0的节点放入第0层；
+        3. 逐层处理节点，将其依赖的节点入度减1，入度为0时放入下一层（每层仅排序一次）；
         4. 循环依赖的节点会被放入最后一层。
 
         Returns:
@@ -1380,51 +2266,56 @@ class MarkdownVisualizer:
         Calculate layered layout of modules based on topological sorting to determine the layer of each module.
 
         Implementation logic:
-        1. Calculate in-degree (number of dependencies) for each node;
-        2. Use Breadth-First Search (BFS), first put nodes with in-degree 0 into layer 0;
-        3. Process nodes layer by layer, decrease in-degree of their dependent nodes by 1, put into next layer when in-degree is 0;
+        1. Map modules to integers in name order and calculate the in-degree (number of dependencies) of each node on the integer adjacency list;
+        2. Advance layer by layer with Kahn's algorithm, first put nodes with in-degree 0 into layer 0;
+        3. Process nodes layer by layer, decrease in-degree of their dependent nodes by 1, put into next layer when in-degree is 0 (each layer is sorted once);
         4. Nodes with cyclic dependencies are put into the last layer.
 
         Returns:
             Dict[int, List[str]]: Layered result dictionary, key is layer index (starting from 0), value is module ID list of the layer.
         """
-        # 初始化入度字典 (Initialize in-degree dictionary)
-        indeg: Dict[str, int] = {u: 0 for u in self.adj}
-        for u, vs in self.adj.items():
+        # 整数邻接表已在解析表格时按名称顺序构建，整数顺序即名称顺序，每层只需排序整数
+        # (The integer adjacency list was built in name order when parsing the table, so integer order is name order and each layer only sorts ints)
+        names: List[str] = self._names
+        succ: List[List[int]] = self._succ
+        # 一次遍历预计算入度 (Precompute in-degrees in one pass)
+        indeg: array = array("i", [0]) * len(names)
+        for vs in succ:
             for v in vs:
-                indeg[v] = indeg.get(v, 0) + 1
+                indeg[v] += 1
 
         layers: Dict[int, List[str]] = {}
         # 入度为0的节点作为起始层 (Nodes with in-degree 0 as starting layer)
-        q: List[str] = [u for u, d in indeg.items() if d == 0]
-        placed: Set[str] = set()
+        current_layer: List[int] = [u for u, d in enumerate(indeg) if d == 0]
+        placed_count: int = 0
         layer_idx: int = 0
 
-        while q:
-            # 存储当前层节点并排序 (Store current layer nodes and sort)
-            layers[layer_idx] = sorted(q)
-            placed.update(q)
-            next_q: List[str] = []
-            # 处理当前层节点的依赖关系 (Process dependencies of current layer nodes)
-            for u in q:
-                for v in self.adj.get(u, []):
-                    indeg[v] -= 1
-                    if indeg[v] == 0:
-                        next_q.append(v)
-            # 去重并排序，准备下一层 (Deduplicate, sort and prepare next layer)
-            q = sorted(set(next_q))
+        while current_layer:
+            # 每层只排序一次，并在输出时映射回模块名 (Sort each layer exactly once and map back to module names on emit)
+            current_layer.sort()
+            layers[layer_idx] = [names[u] for u in current_layer]
+            placed_count += len(current_layer)
+            next_layer: List[int] = []
+            # Kahn 松弛：入度降为0的节点恰好出现一次，无需去重
+            # (Kahn relaxation: a node reaches in-degree 0 exactly once, so no deduplication is needed)
+            for u in current_layer:
+                for v in succ[u]:
+                    d: int = indeg[v] - 1
+                    indeg[v] = d
+                    if d == 0:
+                        next_layer.append(v)
+            current_layer = next_layer
             layer_idx += 1
 
-        # 处理循环依赖的节点（未被放置的节点）(Process cyclic dependency nodes: unplaced nodes)
-        remaining: List[str] = [u for u in self.adj if u not in placed]
-        if remaining:
-            layers[layer_idx] = sorted(remaining)
+        # 处理循环依赖的节点（入度始终未归零的节点）(Process cyclic dependency nodes: in-degree never reached 0)
+        if placed_count < len(names):
+            layers[layer_idx] = [names[u] for u, d in enumerate(indeg) if d > 0]
 
         return layers
 
     def _layout_positions(
         self, layers: Dict[int, List[str]]
-    ) -> Dict[str, Tuple[float, float]]:
+    ) -> Tuple[List[str], array, array]:
         """
         根据分层结果计算每个模块节点在 SVG 画布上的坐标位置。
 
@@ -1433,11 +2324,14 @@ class MarkdownVisualizer:
         2. 逐层计算节点位置：每层水平居中对齐，节点等间距分布；
         3. 节点坐标以中心为基准（便于后续绘制矩形和箭头）。
 
+        坐标以并行数组（结构体数组转数组结构体）保存：第 i 个节点的中心为 (xs[i], ys[i])，不为每个节点分配元组。
+
         Args:
             layers (Dict[int, List[str]]): 分层结果字典，由 _compute_layers() 方法提供。
 
         Returns:
-            Dict[str, Tuple[float, float]]: 节点坐标字典，键为模块ID，值为 (中心x坐标, 中心y坐标)。
+            Tuple[List[str], array, array]: (order, xs, ys)，order 为按层排列的模块ID，
+                xs/ys 为对应下标节点的整数像素中心坐标（array('i')）。
 
         ==========================================
 
@@ -1448,59 +2342,77 @@ class MarkdownVisualizer:
         2. Calculate node positions layer by layer: each layer is horizontally centered, nodes are equally spaced;
         3. Node coordinates are based on the center (facilitating subsequent rectangle and arrow drawing).
 
+        Coordinates are kept in parallel arrays rather than one tuple per node: node i is centred at (xs[i], ys[i]).
+
         Args:
             layers (Dict[int, List[str]]): Layered result dictionary, provided by _compute_layers() method.
 
         Returns:
-            Dict[str, Tuple[float, float]]: Node coordinate dictionary, key is module ID, value is (center x, center y).
+            Tuple[List[str], array, array]: (order, xs, ys), where order lists module IDs layer by layer and
+                xs/ys (array('i')) hold the whole-pixel centre of the node at the same index.
         """
-        positions: Dict[str, Tuple[float, float]] = {}
-        max_width: float = 0.0
-        total_height: float = self.MARGIN * 2  # 上下边距 (Top and bottom margins)
+        order: List[str] = []
+        xs: array = array("i")
+        ys: array = array("i")
+        # 布局常量绑定为局部变量 (Bind layout constants to locals)
+        node_w: int = self.NODE_WIDTH
+        node_h: int = self.NODE_HEIGHT
+        h_spacing: int = self.NODE_H_SPACING
+        v_spacing: int = self.LAYER_V_SPACING
+        margin: int = self.MARGIN
+        max_width: int = 0
+        total_height: int = margin * 2  # 上下边距 (Top and bottom margins)
+        # 每层宽度只计算一次，供两轮遍历共用 (Each layer width is computed once and shared by both passes)
+        layer_widths: Dict[int, int] = {}
 
         # 先计算画布总高度和最大宽度 (First calculate total canvas height and maximum width)
         for li, nodes in layers.items():
-            layer_h: int = self.NODE_HEIGHT
-            total_height += layer_h
+            total_height += node_h
             if li > 0:
-                total_height += self.LAYER_V_SPACING
+                total_height += v_spacing
             # 计算当前层宽度 (Calculate current layer width)
-            layer_w: float = len(nodes) * self.NODE_WIDTH + max(0, len(nodes) - 1) * self.NODE_H_SPACING
+            n: int = len(nodes)
+            layer_w: int = n * node_w + (n - 1) * h_spacing if n else 0
+            layer_widths[li] = layer_w
             if layer_w > max_width:
                 max_width = layer_w
 
         # 确定画布最终宽度 (Determine final canvas width)
-        canvas_w: float = max(300, max_width + self.MARGIN * 2)
-        y: float = self.MARGIN  # 当前层的顶部y坐标 (Top y coordinate of current layer)
+        canvas_w: int = max(300, max_width + margin * 2)
+        y: int = margin  # 当前层的顶部y坐标 (Top y coordinate of current layer)
+        step_x: int = node_w + h_spacing  # 同层相邻节点的中心间距 (Center distance between neighbouring nodes in a layer)
+        # 坐标统一取整数像素，SVG 输出时无需浮点格式化 (Coordinates are whole pixels, so the SVG writer needs no float formatting)
+        half_h: int = node_h // 2
 
         # 计算每个节点的具体坐标 (Calculate specific coordinates for each node)
         for li in sorted(layers):
-            nodes: List[str] = layers[li]
-            layer_w: float = len(nodes) * self.NODE_WIDTH + max(0, len(nodes) - 1) * self.NODE_H_SPACING
             # 层的水平起始位置（居中对齐）(Horizontal start position of layer: center alignment)
-            x0: float = (canvas_w - layer_w) / 2 + self.NODE_WIDTH / 2
+            x0: int = (canvas_w - layer_widths[li]) // 2 + node_w // 2
+            # 节点中心y坐标 (Node center y coordinate)
+            cy: int = y + half_h
 
-            for i, m in enumerate(nodes):
-                # 节点中心x坐标 (Node center x coordinate)
-                cx: float = x0 + i * (self.NODE_WIDTH + self.NODE_H_SPACING)
-                # 节点中心y坐标 (Node center y coordinate)
-                cy: float = y + self.NODE_HEIGHT / 2
-                positions[m] = (cx, cy)
+            row: List[str] = layers[li]
+            n = len(row)
+            order.extend(row)
+            # 同层节点中心x坐标等差排列，y坐标相同 (Centre x steps evenly within a layer; centre y is shared)
+            xs.extend(range(x0, x0 + n * step_x, step_x))
+            ys.extend([cy] * n)
 
             # 移动到下一层的起始y坐标 (Move to start y coordinate of next layer)
-            y += self.NODE_HEIGHT + self.LAYER_V_SPACING
+            y += node_h + v_spacing
 
         # 更新画布尺寸 (Update canvas size)
-        self._canvas_w = math.ceil(canvas_w)
-        self._canvas_h = math.ceil(y + self.MARGIN)
+        self._canvas_w = canvas_w
+        self._canvas_h = y + margin
 
-        return positions
+        return order, xs, ys
 
     def _escape(self, s: str) -> str:
         """
         对字符串进行 HTML 转义，避免特殊字符导致的渲染问题。
 
         转义的特殊字符包括：&、<、>、"、'，确保字符串可安全嵌入 HTML 文档中。
+        通过预先构建的转换表一次 str.translate 完成，结果与 html.escape 一致。
 
         Args:
             s (str): 需要转义的原始字符串（如模块ID、节点文本等）。
@@ -1513,6 +2425,7 @@ class MarkdownVisualizer:
         HTML-escape string to avoid rendering issues caused by special characters.
 
         Escaped special characters include: &, <, >, ", ', ensuring the string can be safely embedded in HTML documents.
+        Done in a single str.translate pass over a prebuilt table, with the same result as html.escape.
 
         Args:
             s (str): Raw string to be escaped (e.g., module ID, node text).
@@ -1520,84 +2433,101 @@ class MarkdownVisualizer:
         Returns:
             str: HTML-escaped safe string.
         """
-        return html.escape(s)
+        return s.translate(self._ESCAPE_TABLE)
 
     def _detect_cycles(self) -> None:
         """
-        采用深度优先搜索（DFS）三色标记法检测项目中的循环依赖。
-
-        标记定义：
-        - WHITE（0）：未访问；
-        - GRAY（1）：正在访问（处于当前 DFS 路径中）；
-        - BLACK（2）：已访问完毕。
+        采用迭代式 Tarjan 强连通分量（SCC）算法检测项目中的循环依赖。
 
         检测逻辑：
-        1. 遍历所有未访问节点，启动 DFS；
-        2. 遇到 GRAY 节点时，说明找到循环路径，回溯构建完整循环；
-        3. 通过字符串化路径去重，避免重复记录相同循环。
+        1. 对每个未访问节点启动 DFS，为节点分配访问序号 index 和可回溯的最小序号 low；
+        2. 节点的 low 等于 index 时，栈中该节点及其上方的节点构成一个强连通分量；
+        3. 节点数大于1的分量，或带自环的单节点分量，即为一组循环依赖。
+
+        与逐条回溯路径相比，SCC 不会遗漏共享节点的循环，且整个过程为 O(V+E) 单次遍历，无需路径字符串去重。
+        使用显式栈迭代实现，不受递归深度限制；模块名先映射为整数，状态保存在 array/bytearray 中以减少内存和哈希开销。
+        每个分量内的节点按名称排序，分量之间按首个节点排序，保证结果稳定。
 
         Returns:
             None
 
         ==========================================
 
-        Detect cyclic dependencies in the project using Depth-First Search (DFS) three-color marking method.
-
-        Marking definition:
-        - WHITE (0): Unvisited;
-        - GRAY (1): Being visited (in current DFS path);
-        - BLACK (2): Visited completely.
+        Detect cyclic dependencies in the project using an iterative Tarjan strongly connected component (SCC) algorithm.
 
         Detection logic:
-        1. Traverse all unvisited nodes and start DFS;
-        2. When encountering a GRAY node, a cyclic path is found, backtrack to build the complete cycle;
-        3. Deduplicate by stringifying paths to avoid recording duplicate cycles.
+        1. Start a DFS from every unvisited node, assigning each node a visit index and a low-link (smallest reachable index);
+        2. When a node's low-link equals its index, it and the nodes above it on the stack form one strongly connected component;
+        3. Components with more than one node, or single-node components with a self-loop, are one group of cyclic dependencies.
+
+        Unlike backtracking individual paths, SCCs never miss cycles that share nodes, and the whole pass is O(V+E)
+        with no path-string deduplication. The explicit stack avoids the recursion limit; module names are first mapped
+        to integers and the per-node state lives in array/bytearray to cut memory and hashing. Nodes within a component are
+        sorted by name and components are sorted by their first node, so the result is stable.
 
         Returns:
             None
         """
-        WHITE, GRAY, BLACK = 0, 1, 2
-        # 初始化节点颜色（均为未访问）(Initialize node colors: all unvisited)
-        color: Dict[str, int] = {n: WHITE for n in self.adj}
-        # 记录节点的父节点，用于回溯构建循环 (Record parent nodes for backtracking to build cycles)
-        parent: Dict[str, Optional[str]] = {}
-        cycles: List[List[str]] = []
-        # 已发现的循环路径（用于去重）(Discovered cyclic paths: for deduplication)
-        seen: Set[str] = set()
-
-        def dfs(u: str) -> None:
-            """DFS 递归函数，检测循环并构建路径 (DFS recursive function to detect cycles and build paths)"""
-            color[u] = GRAY
-            # 遍历当前节点的所有依赖者 (Traverse all dependents of current node)
-            for v in self.adj.get(u, []):
-                if v not in color:
-                    continue
-                if color[v] == WHITE:
-                    parent[v] = u
-                    dfs(v)
-                elif color[v] == GRAY:
-                    # 找到循环，回溯构建路径 (Found cycle, backtrack to build path)
-                    cur: Optional[str] = u
-                    path: List[str] = [v]
-                    while cur != v and cur in parent:
-                        path.append(cur)
-                        cur = parent[cur]
-                    path.append(v)
-                    path.reverse()
-                    # 字符串化路径用于去重 (Stringify path for deduplication)
-                    key: str = "->".join(path)
-                    if key not in seen:
-                        seen.add(key)
-                        cycles.append(path)
-            color[u] = BLACK
-
-        # 对所有未访问节点启动 DFS (Start DFS for all unvisited nodes)
-        for n in list(self.adj.keys()):
-            if color[n] == WHITE:
-                parent[n] = None
-                dfs(n)
-
-        self.cycles = cycles
+        # 算法只在解析表格时构建的整数邻接表和定长数组上运行
+        # (The algorithm runs only on the integer adjacency list built when parsing the table and on fixed-size arrays)
+        names: List[str] = self._names
+        succ: List[List[int]] = self._succ
+        n: int = len(names)
+        # 访问序号（-1 表示未访问）、low 值与入栈标记 (Visit index (-1 = unvisited), low-link and on-stack flags)
+        index: array = array("i", [-1]) * n
+        low: array = array("i", [0]) * n
+        on_stack: bytearray = bytearray(n)
+        # Tarjan 节点栈 (Tarjan node stack)
+        stack: List[int] = []
+        sccs: List[List[str]] = []
+        counter: int = 0
+
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # DFS 工作栈保存 (节点, 邻居迭代器) (DFS work stack holds (node, neighbour iterator))
+            work: List[Tuple[int, Iterator[int]]] = [(root, iter(succ[root]))]
+            while work:
+                u, it = work[-1]
+                for v in it:
+                    if index[v] < 0:
+                        # 未访问邻居：分配序号后深入 (Unvisited neighbour: number it and descend)
+                        index[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        on_stack[v] = 1
+                        work.append((v, iter(succ[v])))
+                        break
+                    if on_stack[v] and index[v] < low[u]:
+                        low[u] = index[v]
+                else:
+                    # 邻居遍历完毕：回传 low 值，并在根节点处弹出分量
+                    # (All neighbours visited: propagate low-link and pop the component at its root)
+                    work.pop()
+                    if work:
+                        parent: int = work[-1][0]
+                        if low[u] < low[parent]:
+                            low[parent] = low[u]
+                    if low[u] == index[u]:
+                        scc: List[int] = []
+                        while True:
+                            w: int = stack.pop()
+                            on_stack[w] = 0
+                            scc.append(w)
+                            if w == u:
+                                break
+                        if len(scc) > 1 or u in succ[u]:
+                            # 映射回模块名 (Map back to module names)
+                            sccs.append(sorted(names[i] for i in scc))
+
+        sccs.sort()
+        self.cycles = sccs
+        # 顺带收集循环中的全部节点，供渲染时直接使用 (Collect all nodes in cycles here so rendering can use them directly)
+        self.cycle_nodes = {m for scc in sccs for m in scc}
 
     # ---------------- 分组样式匹配方法 (Group Style Matching Method) ----------------
     def _get_group_style(self, module_id: str) -> Tuple[str, str]:
@@ -1606,6 +2536,8 @@ class MarkdownVisualizer:
 
         匹配逻辑：按 GROUP_CONFIG 中的顺序依次匹配，首个匹配的分组即为目标分组，
         若均不匹配则返回默认样式（深灰色边框，白色背景）。
+        所有分组正则已在初始化时合并为 _group_re，一次匹配后通过命名组（lastgroup）确定分组；
+        GROUP_CONFIG 含匹配函数时则按顺序逐个调用 _group_matchers 中的匹配函数。
 
         Args:
             module_id (str): 需要匹配分组的模块ID（如 "main"、"drivers/uart"）。
@@ -1619,6 +2551,8 @@ class MarkdownVisualizer:
 
         Matching logic: Match in the order of GROUP_CONFIG, the first matching group is the target group,
         return default style (dark gray border, white background) if no match.
+        All group regexes are merged into _group_re at initialization; a single match identifies the group via its named group (lastgroup).
+        When GROUP_CONFIG contains matching functions, the matchers in _group_matchers are called in order instead.
 
         Args:
             module_id (str): Module ID to match group (e.g., "main", "drivers/uart").
@@ -1626,172 +2560,189 @@ class MarkdownVisualizer:
         Returns:
             Tuple[str, str]: Group style, first element is border color (hex string), second is background color.
         """
-        for name, (match_func, border_color, bg_color) in self.GROUP_CONFIG.items():
-            if match_func(module_id):
-                return (border_color, bg_color)
+        group_re: Optional[re.Pattern] = self._group_re
+        if group_re is not None:
+            m: Optional[re.Match] = group_re.match(module_id)
+            if m is not None:
+                return self._group_styles[m.lastgroup]
+        else:
+            for matcher, style in self._group_matchers:
+                if matcher(module_id):
+                    return style
         # 默认样式（非分组模块）(Default style: non-grouped modules)
         return ("#333", "#ffffff")
 
     # ---------------- SVG 渲染部分 (SVG Rendering Section) ----------------
-    def _render_svg(self, positions: Dict[str, Tuple[float, float]]) -> str:
+    def _render_svg(self, order: List[str], xs: array, ys: array, out: BinaryIO) -> None:
         """
-        基于节点坐标生成 SVG 图形字符串，包含箭头和模块节点。
+        基于节点坐标生成 SVG 图形（箭头和模块节点），逐项直接写入输出文件。
 
         渲染流程：
         1. 定义箭头标记（marker），用于箭头端点；
-        2. 绘制依赖边：根据邻接表绘制贝塞尔曲线箭头，多箭头自动分散；
+        2. 绘制依赖边：根据邻接表绘制贝塞尔曲线箭头，公共的描边与箭头属性只在外层 <g> 上写一次；
         3. 绘制模块节点：根据分组样式和循环依赖状态绘制矩形和文本；
-        4. 组装 SVG 字符串，包含命名空间和画布尺寸信息。
+        4. SVG 开始标签（含命名空间和画布尺寸）与结束标签同样直接写出。
+
+        各项之间以换行分隔，不在内存中累积整个 SVG。边只含 ASCII 数字，直接以字节模板格式化；
+        节点含模块ID，格式化后编码一次。
 
         Args:
-            positions (Dict[str, Tuple[float, float]]: 节点坐标字典，由 _layout_positions() 方法提供。
+            order (List[str]): 按下标排列的模块ID，由 _layout_positions() 方法提供。
+            xs (array): 各下标节点的中心x坐标。
+            ys (array): 各下标节点的中心y坐标。
+            out (BinaryIO): 已打开的二进制输出文件（带缓冲），SVG 内容以 UTF-8 字节写入其中。
 
         Returns:
-            str: 完整的 SVG 图形字符串，可直接嵌入 HTML 文档。
+            None
 
         ==========================================
 
-        Generate SVG graphic string based on node coordinates, including arrows and module nodes.
+        Generate the SVG graphic (arrows and module nodes) from node coordinates, writing each item directly to the output file.
 
         Rendering process:
         1. Define arrow marker for arrow endpoints;
-        2. Draw dependency edges: draw Bezier curve arrows based on adjacency list, multiple arrows are automatically spaced;
+        2. Draw dependency edges: draw Bezier curve arrows based on adjacency list, with the shared stroke and arrow attributes written once on an enclosing <g>;
         3. Draw module nodes: draw rectangles and text based on group style and cyclic dependency status;
-        4. Assemble SVG string with namespace and canvas size information.
+        4. The opening SVG tag (with namespace and canvas size) and the closing tag are written directly as well.
+
+        Items are separated by newlines, and the whole SVG is never accumulated in memory. Edges contain only ASCII
+        numbers and are formatted straight from a bytes template; nodes carry module IDs and are encoded once after formatting.
 
         Args:
-            positions (Dict[str, Tuple[float, float]: Node coordinate dictionary, provided by _layout_positions() method.
+            order (List[str]): Module IDs by index, provided by _layout_positions() method.
+            xs (array): Centre x coordinate of the node at each index.
+            ys (array): Centre y coordinate of the node at each index.
+            out (BinaryIO): Opened (buffered) binary output file that receives the SVG content as UTF-8 bytes.
 
         Returns:
-            str: Complete SVG graphic string, can be directly embedded in HTML documents.
+            None
         """
-        svg_items: List[str] = []
-        # 重置箭头计数器 (Reset arrow counter)
-        self.edge_counter = {}
+        # 画布尺寸已由 _layout_positions 确定，首先写出 SVG 开始标签
+        # (Canvas size is already set by _layout_positions, so the opening SVG tag is written first)
+        w: int = self._canvas_w
+        h: int = self._canvas_h
+        write = out.write
+        write(self._SVG_OPEN_FMT % (w, h, w, h))
+
+        # 循环中频繁访问的属性和方法绑定为局部变量 (Bind attributes and methods used in hot loops to locals)
+        nw: int = self.NODE_WIDTH
+        nh: int = self.NODE_HEIGHT
+        ao: int = self.ARROW_OFFSET
+        get_group_style = self._get_group_style
+        escape = self._escape
+        # 预格式化模板（以换行开头分隔各项），循环内仅做一次 % 格式化；坐标为整数像素，
+        # 贝塞尔控制点以 %d 截断取整 (Preformatted templates, each starting with the newline that separates items;
+        # a single % format per item inside the loops. Coordinates are whole pixels and %d truncates the Bezier control points)
+        # 边模板为字节串，格式化结果无需再编码；描边与箭头属性由外层 <g> 统一继承，每条边只输出路径
+        # (The edge template is bytes, so its result needs no encoding; stroke and arrow attributes are inherited
+        # from the enclosing <g>, so each edge emits only its path)
+        edge_tpl: bytes = b'\n<path d="M %d,%d C %d,%d %d,%d %d,%d" />'
+        node_tpl: str = (
+            '\n<g class="node" data-id="%%s">\n'
+            '<rect x="%%d" y="%%d" width="%d" height="%d" rx="6" ry="6" fill="%%s" stroke="%%s" stroke-width="1.5" />\n'
+            '<text x="%%d" y="%%d" font-family="sans-serif" font-size="14">%%s</text>\n'
+            "</g>"
+        ) % (nw, nh)
+        # 半宽、半高、四分之一宽只计算一次 (Half width, half height and quarter width computed once)
+        hw: int = nw // 2
+        hh: int = nh // 2
+        qw: float = nw / 4
+        # 箭头端点相对节点中心的偏移 (Offsets of arrow endpoints from the node centre)
+        ox: int = hw - ao
+        oy: int = hh - ao
+
+        # 循环依赖中的节点已由 _detect_cycles 收集 (Nodes in cyclic dependencies were collected by _detect_cycles)
+        cycle_nodes: Set[str] = self.cycle_nodes
+        # 样式优先级：循环依赖 > 分组样式 > 默认样式；无循环（常见情况）时直接使用分组样式，省去逐节点的集合判断
+        # (Style priority: cyclic > group > default; without cycles (the common case) use the group style directly, skipping the per-node set test)
+        if cycle_nodes:
+            def style_of(m: str) -> Tuple[str, str]:
+                return ("#c33", "#ffecec") if m in cycle_nodes else get_group_style(m)
+        else:
+            style_of = get_group_style
 
-        # 1. 定义箭头标记 (Define arrow marker)
-        svg_items.append(
-            f"""<defs>
-            <marker id="arrow" markerWidth="18" markerHeight="18" refX="16" refY="9" orient="auto">
-                <path d="M0,0 L18,9 L0,18 z" fill="#555" />
-            </marker>
-        </defs>"""
-        )
+        # 模块ID到数组下标的映射 (Mapping from module ID to array index)
+        idx_get = {m: i for i, m in enumerate(order)}.get
 
-        # 2. 绘制依赖边 (Draw dependency edges)
-        for u, vs in self.adj.items():
-            if u not in positions:
+        # 1. 定义箭头标记 (Define arrow marker)
+        write(b"\n")
+        write(self._SVG_DEFS)
+
+        # 2. 绘制依赖边，全部边共享一个带公共样式的分组 (Draw dependency edges inside one group carrying their shared style)
+        write(b'\n<g class="edges" fill="none" stroke="#555" stroke-width="2.0" marker-end="url(#arrow)">')
+        for u, sorted_vs in self._sorted_adj.items():
+            ui: Optional[int] = idx_get(u)
+            if ui is None:
                 continue
-            ux, uy = positions[u]
+            ux: int = xs[ui]
+            uy: int = ys[ui]
+            # 源节点相关的水平判定阈值按源节点计算一次 (Horizontal thresholds depend only on the source, compute once)
+            right_bound: float = ux + qw
+            left_bound: float = ux - qw
 
-            # 对目标节点排序，确保箭头顺序一致 (Sort target nodes for consistent arrow order)
-            sorted_vs: List[str] = sorted(vs)
+            # 目标节点已预先排序，确保箭头顺序一致 (Targets are pre-sorted for consistent arrow order)
             for v in sorted_vs:
-                if v not in positions:
+                vi: Optional[int] = idx_get(v)
+                if vi is None:
                     continue
-                vx, vy = positions[v]
-
-                # 跟踪同一对节点的箭头数量，计算偏移量 (Track arrow count for same node pair, calculate offset)
-                edge_key: Tuple[str, str] = (u, v)
-                self.edge_counter[edge_key] = self.edge_counter.get(edge_key, 0) + 1
-                edge_index: int = self.edge_counter[edge_key] - 1
-
-                # 多箭头时分散排列 (Space out multiple arrows)
-                offset: float = 0.0
-                if self.edge_counter[edge_key] > 1:
-                    mid: float = (self.edge_counter[edge_key] - 1) / 2
-                    offset = (edge_index - mid) * self.ARROW_SPACING
-
-                # 计算箭头起点（远离源节点u）(Calculate arrow start point: away from source node u)
-                if vx > ux + self.NODE_WIDTH / 4:  # 目标在右侧 (Target on the right)
-                    start_x = ux + self.NODE_WIDTH / 2 - self.ARROW_OFFSET
-                    start_y = uy + offset
-                elif vx < ux - self.NODE_WIDTH / 4:  # 目标在左侧 (Target on the left)
-                    start_x = ux - self.NODE_WIDTH / 2 + self.ARROW_OFFSET
-                    start_y = uy + offset
-                elif vy > uy:  # 目标在下方 (Target below)
-                    start_x = ux + offset
-                    start_y = uy + self.NODE_HEIGHT / 2 - self.ARROW_OFFSET
-                else:  # 目标在上方 (Target above)
-                    start_x = ux + offset
-                    start_y = uy - self.NODE_HEIGHT / 2 + self.ARROW_OFFSET
-
-                # 计算箭头终点（远离目标节点v）(Calculate arrow end point: away from target node v)
-                if vx > ux + self.NODE_WIDTH / 4:  # 从右侧进入 (Enter from right)
-                    end_x = vx - self.NODE_WIDTH / 2 + self.ARROW_OFFSET
-                    end_y = vy + offset
-                elif vx < ux - self.NODE_WIDTH / 4:  # 从左侧进入 (Enter from left)
-                    end_x = vx + self.NODE_WIDTH / 2 - self.ARROW_OFFSET
-                    end_y = vy + offset
-                elif vy > uy:  # 从上方进入 (Enter from above)
-                    end_x = vx + offset
-                    end_y = vy - self.NODE_HEIGHT / 2 + self.ARROW_OFFSET
-                else:  # 从下方进入 (Enter from below)
-                    end_x = vx + offset
-                    end_y = vy + self.NODE_HEIGHT / 2 - self.ARROW_OFFSET
+                vx: int = xs[vi]
+                vy: int = ys[vi]
+
+                # 邻接表为集合，同一对节点间至多一条边，无需分散偏移
+                # (The adjacency is set-valued, so there is at most one edge per node pair and no spreading offset is needed)
+                # 一次比较链确定方向，起点在源节点一侧，终点在目标节点对侧
+                # (One comparison chain picks the direction; the start is on one side of the source and the end on the opposite side of the target)
+                if vx > right_bound:  # 目标在右侧：右出左入 (Target on the right: leave right, enter left)
+                    start_x, start_y, end_x, end_y = ux + ox, uy, vx - ox, vy
+                elif vx < left_bound:  # 目标在左侧：左出右入 (Target on the left: leave left, enter right)
+                    start_x, start_y, end_x, end_y = ux - ox, uy, vx + ox, vy
+                elif vy > uy:  # 目标在下方：下出上入 (Target below: leave bottom, enter top)
+                    start_x, start_y, end_x, end_y = ux, uy + oy, vx, vy - oy
+                else:  # 目标在上方：上出下入 (Target above: leave top, enter bottom)
+                    start_x, start_y, end_x, end_y = ux, uy - oy, vx, vy + oy
 
                 # 计算贝塞尔曲线控制点，使路径自然 (Calculate Bezier curve control points for natural path)
                 dx: float = end_x - start_x
                 dy: float = end_y - start_y
-                if abs(dx) > abs(dy):  # 水平为主 (Horizontal main direction)
-                    curve_factor: float = 0.4 if abs(dx) > 100 else 0.6
+                adx: float = dx if dx >= 0 else -dx
+                ady: float = dy if dy >= 0 else -dy
+                if adx > ady:  # 水平为主 (Horizontal main direction)
+                    curve_factor: float = 0.4 if adx > 100 else 0.6
                     cx1 = start_x + dx * curve_factor
                     cy1 = start_y + dy * 0.1
                     cx2 = end_x - dx * curve_factor
                     cy2 = end_y - dy * 0.1
                 else:  # 垂直为主 (Vertical main direction)
-                    curve_factor: float = 0.4 if abs(dy) > 100 else 0.6
+                    curve_factor: float = 0.4 if ady > 100 else 0.6
                     cx1 = start_x + dx * 0.1
                     cy1 = start_y + dy * curve_factor
                     cx2 = end_x - dx * 0.1
                     cy2 = end_y - dy * curve_factor
 
-                # 绘制曲线箭头 (Draw curved arrow)
-                path: str = f"M {start_x:.1f},{start_y:.1f} C {cx1:.1f},{cy1:.1f} {cx2:.1f},{cy2:.1f} {end_x:.1f},{end_y:.1f}"
-                svg_items.append(
-                    f'<path d="{path}" fill="none" stroke="#555" stroke-width="2.0" marker-end="url(#arrow)" />'
-                )
+                # 绘制曲线箭头：一次 % 格式化输出整条路径 (Draw curved arrow: one % format call for the whole path)
+                write(edge_tpl % (start_x, start_y, cx1, cy1, cx2, cy2, end_x, end_y))
 
-        # 3. 绘制节点（应用分组样式）(Draw nodes with group styles)
-        # 收集循环依赖中的节点 (Collect nodes in cyclic dependencies)
-        cycle_nodes: Set[str] = set()
-        for cyc in self.cycles:
-            cycle_nodes.update(cyc)
+        write(b"\n</g>")
 
-        for m, pos in positions.items():
-            cx, cy = pos
+        # 3. 绘制节点（应用分组样式）(Draw nodes with group styles)
+        for i, m in enumerate(order):
+            stroke, fill = style_of(m)
+            esc_id: str = escape(m)
+            # 文本过长时截断；未截断时显示文本与ID相同，直接复用转义结果
+            # (Truncate long text; when not truncated the display text equals the id, so reuse its escaped form)
+            esc_display: str = esc_id if len(m) <= 50 else escape(m[:46] + "...")
+            cy: int = ys[i]
             # 节点左上角坐标 (Node top-left coordinates)
-            x: float = cx - self.NODE_WIDTH / 2
-            y: float = cy - self.NODE_HEIGHT / 2
-            # 判断是否为循环依赖节点 (Check if node is in cyclic dependency)
-            is_cycle: bool = m in cycle_nodes
-
-            # 样式优先级：循环依赖 > 分组样式 > 默认样式 (Style priority: cyclic > group > default)
-            if is_cycle:
-                fill: str = "#ffecec"
-                stroke: str = "#c33"
-            else:
-                stroke, fill = self._get_group_style(m)
-
-            # 绘制节点矩形和文本 (Draw node rectangle and text)
-            svg_items.append(f'<g class="node" data-id="{self._escape(m)}">')
-            svg_items.append(
-                f'<rect x="{x:.1f}" y="{y:.1f}" width="{self.NODE_WIDTH}" height="{self.NODE_HEIGHT}" rx="6" ry="6" fill="{fill}" stroke="{stroke}" stroke-width="1.5" />'
-            )
-            # 文本过长时截断 (Truncate long text)
-            display: str = m if len(m) <= 50 else (m[:46] + "...")
-            svg_items.append(
-                f'<text x="{(cx - self.NODE_WIDTH / 2) + 10:.1f}" y="{cy + 7:.1f}" font-family="sans-serif" font-size="14">{self._escape(display)}</text>'
-            )
-            svg_items.append("</g>")
+            x: int = xs[i] - hw
+            y: int = cy - hh
+            # 绘制节点分组、矩形和文本 (Draw node group, rectangle and text)
+            write((node_tpl % (esc_id, x, y, fill, stroke, x + 10, cy + 7, esc_display)).encode("utf-8"))
 
-        # 4. 组装SVG (Assemble SVG)
-        svg_body: str = "\n".join(svg_items)
-        svg: str = f'<svg width="{self._canvas_w}" height="{self._canvas_h}" viewBox="0 0 {self._canvas_w} {self._canvas_h}" xmlns="http://www.w3.org/2000/svg" role="img">\n{svg_body}\n</svg>'
-        return svg
+        # 4. 结束标签 (Closing tag)
+        write(b"\n</svg>")
 
     # ---------------- HTML 组装部分 (HTML Assembly Section) ----------------
-    def _assemble_html(self, svg: str, title: str) -> str:
+    def _assemble_html(self, title: str) -> Tuple[List[str], str]:
         """
         组装完整的 HTML 文档，包含 SVG 图形和样式，修复缩进格式。
 
@@ -1803,11 +2754,11 @@ class MarkdownVisualizer:
         缩进优化：采用 4 空格缩进，确保 HTML 代码结构清晰，符合前端规范。
 
         Args:
-            svg (str): SVG 图形字符串，由 _render_svg() 方法提供。
             title (str): HTML 页面的标题（显示在浏览器标签栏）。
 
         Returns:
-            str: 完整的 HTML 文档字符串，格式整洁可直接写入文件。
+            Tuple[List[str], str]: 第一个元素为 SVG 之前按顺序排列的文档片段（头部、循环提示、分组图例、画布容器），
+                第二个元素为 SVG 之后的尾部；SVG 本身由 _render_svg() 在两者之间直接写入文件。
 
         ==========================================
 
@@ -1821,69 +2772,45 @@ class MarkdownVisualizer:
         Indentation optimization: Use 4-space indentation to ensure clear HTML code structure, conforming to front-end specifications.
 
         Args:
-            svg (str): SVG graphic string, provided by _render_svg() method.
             title (str): HTML page title (displayed in browser tab).
 
         Returns:
-            str: Complete HTML document string with clean format, can be directly written to file.
+            Tuple[List[str], str]: The first element holds the document chunks before the SVG in order (head, cycle prompt, group legend, canvas container),
+                the second is the tail after the SVG; the SVG itself is written to the file between them by _render_svg().
         """
         # 循环依赖提示（存在循环时显示）(Cyclic dependency prompt: displayed when cycles exist)
         cycle_note: str = ""
         if self.cycles:
             cycle_note = f'<p style="color:#a33">注意：检测到 {len(self.cycles)} 个循环依赖（部分节点）。循环节点用红色标注。</p>'
 
-        # 分组图例（固定格式）(Group legend: fixed format)
-        group_legend: str = '''
-        <div class="group-legend" style="margin: 12px 0; padding: 8px; background: #f0f0f0; border-radius: 4px;">
-            <p style="margin: 0 0 8px 0; font-weight: bold;">模块分组说明：</p>
-            <ul style="margin: 0; padding-left: 20px; line-height: 1.6;">
-                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #2563eb; background: #eff6ff;"></span>引导核心：boot、main.py</li>
-                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #7c3aed; background: #f5f3ff;"></span>板级配置：board、conf</li>
-                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #16a34a; background: #ecfdf5;"></span>任务层：tasks/ 下所有任务文件</li>
-                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #ea580c; background: #fff7ed;"></span>驱动层：drivers/ 下所有驱动包</li>
-                <li><span style="display: inline-block; width: 12px; height: 12px; margin-right: 8px; border: 1px solid #0891b2; background: #ecfeff;"></span>公共库：libs/ 下所有工具库（logger/network 等）</li>
-            </ul>
-        </div>'''
+        # 标题在 <title> 与 <h2> 中各用一次，只转义一次 (The title is used in both <title> and <h2>; escape it once)
+        esc_title: str = self._escape(title)
 
-        # 组装完整HTML（统一4空格缩进）(Assemble complete HTML with 4-space indentation)
-        html_doc: str = f'''<!doctype html>
+        # 组装完整HTML（统一4空格缩进），SVG 前后的固定部分分别生成 (Assemble complete HTML with 4-space indentation; fixed parts before and after the SVG are built separately)
+        head: str = f'''<!doctype html>
         <html>
         <head>
             <meta charset="utf-8" />
-            <title>{html.escape(title)}</title>
-            <style>
-                body {{ 
-                    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial; 
-                    padding: 16px; 
-                }}
-                .svg-wrap {{ 
-                    border: 1px solid #ddd; 
-                    overflow: auto; 
-                    padding: 16px; 
-                    background: #fafafa; 
-                }}
-                .legend {{ 
-                    margin-top: 12px; 
-                    font-size: 14px; 
-                    color: #444; 
-                }}
-                .group-legend {{ 
-                    font-size: 14px; 
-                    color: #444; 
-                }}
-            </style>
+            <title>{esc_title}</title>
+            {self._HTML_STYLE}
         </head>
         <body>
-            <h2>{html.escape(title)}</h2>
-            {cycle_note}
-            {group_legend}
-            <div class="svg-wrap">{svg}</div>
+            <h2>{esc_title}</h2>
+            '''
+        tail: str = '''</div>
             <div class="legend">
                 <p><strong>说明：</strong>节点表示 module_id（相对路径或规范化名），箭头从被依赖模块指向依赖它的模块。环路节点用红色背景。</p>
             </div>
         </body>
         </html>'''
-        return html_doc
+        # SVG 前后的部分分别返回，SVG 由调用方直接写入文件 (Return the parts before and after the SVG; the caller writes the SVG to the file directly)
+        return [
+            head,
+            cycle_note,
+            "\n            ",
+            self._GROUP_LEGEND_HTML,
+            '\n            <div class="svg-wrap">',
+        ], tail
 
     # ---------------- 对外 API (Public API) ----------------
     def generate_html(self, out_html: str) -> None:
@@ -1895,10 +2822,14 @@ class MarkdownVisualizer:
         2. 解析表格提取模块信息和依赖关系；
         3. 检测循环依赖；
         4. 计算模块分层布局和坐标位置；
-        5. 生成 SVG 图形；
-        6. 组装 HTML 文档并写入文件。
+        5. 组装 SVG 前后的 HTML 文档片段；
+        6. 依次写出 SVG 之前的片段、由 _render_svg 直接写出的 SVG 以及尾部（1 MiB 写缓冲）。
+
+        步骤3-6由 _write_html 完成，内容先写入同目录下的临时文件，成功后用 os.replace 原子替换目标文件；
+        任何一步抛出异常时删除临时文件并重新抛出，原有的 HTML 文件保持不变。
 
         辅助处理：自动创建输出目录（若不存在），确保文件正常写入。
+        报告中没有任何模块时跳过循环检测、布局与渲染，只写出一个最简页面。
 
         Args:
             out_html (str): 输出 HTML 文件的路径（支持相对路径或绝对路径）。
@@ -1915,10 +2846,14 @@ class MarkdownVisualizer:
         2. Parse table to extract module information and dependencies;
         3. Detect cyclic dependencies;
         4. Calculate module layered layout and coordinate positions;
-        5. Generate SVG graphics;
-        6. Assemble HTML document and write to file.
+        5. Assemble the HTML document chunks around the SVG;
+        6. Write the chunks before the SVG, the SVG streamed by _render_svg and the tail in turn (1 MiB write buffer).
+
+        Steps 3-6 are done by _write_html into a temporary file in the same directory, which replaces the target with os.replace
+        once complete; if any step raises, the temporary file is removed and the exception re-raised, leaving any existing HTML untouched.
 
         Auxiliary processing: Automatically create output directory (if not exists) to ensure normal file writing.
+        When the report contains no modules, cycle detection, layout and rendering are skipped and a minimal page is written.
 
         Args:
             out_html (str): Output HTML file path (supports relative or absolute path).
@@ -1930,33 +2865,86 @@ class MarkdownVisualizer:
         lines: List[str] = self._read_md()
         # 2. 解析 MD 表格 (Parse MD table)
         self._parse_md_table(lines)
-        # 3. 检测循环依赖 (Detect cyclic dependencies)
-        self._detect_cycles()
-        # 4. 计算分层布局 (Calculate layered layout)
-        layers: Dict[int, List[str]] = self._compute_layers()
-        # 5. 计算节点位置 (Calculate node positions)
-        positions: Dict[str, Tuple[float, float]] = self._layout_positions(layers)
-        # 6. 生成 SVG (Generate SVG)
-        svg: str = self._render_svg(positions)
-        # 7. 组装 HTML (Assemble HTML)
-        html_doc: str = self._assemble_html(
-            svg, title=f"依赖可视化：{os.path.basename(self.md_path)}"
-        )
+        title: str = f"依赖可视化：{os.path.basename(self.md_path)}"
 
         # 确保输出目录存在 (Ensure output directory exists)
         out_dir: str = os.path.dirname(out_html)
         if out_dir and not os.path.exists(out_dir):
             os.makedirs(out_dir, exist_ok=True)
 
-        # 写入 HTML 文件 (Write to HTML file)
-        with open(out_html, "w", encoding="utf-8") as f:
-            f.write(html_doc)
+        # 先写入同目录下的临时文件，完成后再原子替换，渲染中途出错不会留下截断的 HTML
+        # (Write to a temporary file in the same directory and atomically replace at the end, so a failure while
+        # rendering never leaves a truncated HTML file behind)
+        tmp_html: str = f"{out_html}.{os.getpid()}.tmp"
+        try:
+            self._write_html(title, tmp_html)
+            os.replace(tmp_html, out_html)
+        except BaseException:
+            try:
+                os.remove(tmp_html)
+            except OSError:
+                pass
+            raise
+
+    def _write_html(self, title: str, path: str) -> None:
+        """
+        内部方法：执行循环检测、布局与渲染，并将完整 HTML 写入指定路径（由 generate_html 负责临时文件与原子替换）。
+
+        报告中没有任何模块时跳过循环检测、布局与渲染，只写出一个最简页面。
+
+        Args:
+            title (str): 页面标题（未转义）。
+            path (str): 写入的目标文件路径。
+
+        Returns:
+            None
+
+        ==========================================
+
+        Internal method: Run cycle detection, layout and rendering and write the complete HTML to the given path
+        (generate_html takes care of the temporary file and the atomic replace).
+
+        When the report contains no modules, cycle detection, layout and rendering are skipped and a minimal page is written.
+
+        Args:
+            title (str): Page title (unescaped).
+            path (str): Path of the file to write.
+
+        Returns:
+            None
+        """
+        # 没有任何模块时无需检测、布局和渲染，直接写出最简页面 (With no modules there is nothing to detect, lay out or render; write the minimal page)
+        if not self.nodes:
+            esc_title: str = self._escape(title)
+            with open(path, "wb") as f:
+                f.write((self._EMPTY_HTML_FMT % (esc_title, esc_title)).encode("utf-8"))
+            return
+
+        # 3. 检测循环依赖 (Detect cyclic dependencies)
+        self._detect_cycles()
+        # 4. 计算分层布局 (Calculate layered layout)
+        layers: Dict[int, List[str]] = self._compute_layers()
+        # 5. 计算节点位置 (Calculate node positions)
+        order, xs, ys = self._layout_positions(layers)
+        # 6. 组装 SVG 前后的 HTML 片段 (Assemble the HTML chunks around the SVG)
+        head_chunks, tail = self._assemble_html(title=title)
+
+        # 7. 以二进制模式写入 HTML 文件（UTF-8 字节，绕过文本层逐次编码），SVG 直接流式写出，不在内存中拼成整体
+        # (Write the HTML file in binary mode as UTF-8 bytes, bypassing the text layer's per-write encoding;
+        # the SVG is streamed directly instead of being built in memory as a whole)
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write("".join(head_chunks).encode("utf-8"))
+            self._render_svg(order, xs, ys, f)
+            f.write(tail.encode("utf-8"))
 
 # ======================================== 初始化配置 ==========================================
 
 # ========================================  主程序  ===========================================
 
 if __name__ == "__main__":
+    # 命令行解析只在脚本方式运行时需要 (Argument parsing is only needed when run as a script)
+    import argparse
+
     # 计算默认路径
     script_dir = os.path.dirname(os.path.abspath(__file__))
     repo_root = os.path.abspath(os.path.join(script_dir, ".."))
@@ -2015,6 +3003,13 @@ if __name__ == "__main__":
         action="store_true"
     )
 
+    # 可选参数：禁用导入缓存
+    parser.add_argument(
+        "--no-cache",
+        help="不读取也不写入导入解析缓存（默认缓存位于 Markdown 报告同目录）",
+        action="store_true"
+    )
+
     # 可选参数：生成可视化
     parser.add_argument(
         "--visualize",
@@ -2035,8 +3030,10 @@ if __name__ == "__main__":
         print(f"错误：指定的目录 '{args.root}' 不存在或不是一个目录", file=sys.stderr)
         sys.exit(2)
 
+    # 报告的绝对路径只计算一次，输出目录与后续提示、可视化路径共用
+    md_out = os.path.abspath(args.output)
     # 确保输出目录存在
-    out_dir = os.path.dirname(os.path.abspath(args.output))
+    out_dir = os.path.dirname(md_out)
     if out_dir and not os.path.exists(out_dir):
         try:
             os.makedirs(out_dir, exist_ok=True)
@@ -2049,12 +3046,12 @@ if __name__ == "__main__":
         analyzer = DependencyAnalyzer(
             root=args.root,
             out_md=args.output,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            cache_path=None if args.no_cache else os.path.join(out_dir, ".dependency_cache.json"),
         )
         analyzer.run()
 
         # 输出报告生成信息
-        md_out = os.path.abspath(args.output)
         print(f"✅ 依赖分析完成：报告已生成 -> {md_out}")
 
         # 处理可视化请求
@@ -2064,15 +3061,12 @@ if __name__ == "__main__":
                 # 使用默认路径（与MD报告同目录）
                 out_html = os.path.splitext(md_out)[0] + ".html"
             else:
-                # 使用用户指定的路径
+                # 使用用户指定的路径（输出目录由 generate_html 负责创建）
                 out_html = os.path.abspath(args.visualize)
-                # 确保可视化输出目录存在
-                viz_dir = os.path.dirname(out_html)
-                if viz_dir and not os.path.exists(viz_dir):
-                    os.makedirs(viz_dir, exist_ok=True)
 
             # 生成可视化HTML
-            vis = MarkdownVisualizer(md_path=md_out)
+            # 报告刚由分析器生成时直接复用其内存中的行，否则（如命中缓存）从文件读取
+            vis = MarkdownVisualizer(md_path=md_out, preparsed_lines=analyzer.md_lines)
             vis.generate_html(out_html)
             print(f"✅ 可视化完成：HTML已生成 -> {out_html}")
 